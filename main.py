@@ -12,6 +12,7 @@ Usage:
     python main.py --ui                                     # Start web UI
     python main.py --input-mode audio --audio recording.mp3 # Audio-only mode
     python main.py --theme neon                             # Use neon color theme
+    python main.py --video-encoder libx264                  # Force software encoding
 """
 
 import argparse
@@ -110,6 +111,12 @@ def parse_args() -> argparse.Namespace:
         choices=["dark", "light", "sepia", "neon"],
         help="Color theme preset (default: dark)",
     )
+    parser.add_argument(
+        "--video-encoder",
+        default="auto",
+        help="ffmpeg H.264 encoder, e.g. libx264 or h264_videotoolbox "
+             "(default: auto, uses a hardware encoder when one works)",
+    )
     return parser.parse_args()
 
 
@@ -175,6 +182,7 @@ def main():
         fps=args.fps,
         font_size=font_size,
         max_words_per_chunk=args.max_words_per_chunk,
+        video_encoder=args.video_encoder,
     )
     settings.apply_theme(args.theme)
 
@@ -9,6 +9,35 @@ import mlx_whisper
 DEFAULT_MODEL = "mlx-community/whisper-large-v3-turbo"
 
 
+def whisper_transcribe(audio_path: str, **kwargs) -> dict:
+    """Run mlx-whisper with the shared model.
+
+    mlx-whisper keeps the most recently loaded model in memory and reuses it
+    as long as the same repo is requested, so routing every call through
+    here (one ``DEFAULT_MODEL``) means the weights load once per process.
+    """
+    return mlx_whisper.transcribe(audio_path, path_or_hf_repo=DEFAULT_MODEL, **kwargs)
+
+
+def _words_from_result(result: dict) -> list[dict]:
+    """Flatten Whisper segments into ``{"word", "start", "end"}`` dicts."""
+    words = []
+    for segment in result.get("segments", []):
+        for w in segment.get("words", []):
+            words.append({
+                "word": w["word"].strip(),
+                "start": float(w["start"]),
+                "end": float(w["end"]),
+            })
+    return words
+
+
+def transcribe_with_timestamps(audio_path: str) -> tuple[str, list[dict]]:
+    """Transcribe audio and return ``(text, words)`` from a single Whisper pass."""
+    result = whisper_transcribe(audio_path, word_timestamps=True)
+    return result.get("text", "").strip(), _words_from_result(result)
+
+
 def get_word_timestamps(audio_path: str, progress_callback=None) -> list[dict]:
     """
     Transcribe audio and return word-level timestamps using local Whisper.
@@ -26,20 +55,8 @@ def get_word_timestamps(audio_path: str, progress_callback=None) -> list[dict]:
     if progress_callback:
         progress_callback("alignment", 0.0, "Aligning audio (local Whisper)...")
 
-    result = mlx_whisper.transcribe(
-        audio_path,
-        path_or_hf_repo=DEFAULT_MODEL,
-        word_timestamps=True,
-    )
-
-    words = []
-    for segment in result.get("segments", []):
-        for w in segment.get("words", []):
-            words.append({
-                "word": w["word"].strip(),
-                "start": float(w["start"]),
-                "end": float(w["end"]),
-            })
+    result = whisper_transcribe(audio_path, word_timestamps=True)
+    words = _words_from_result(result)
 
     if not words:
         raise ValueError(
@@ -110,6 +110,9 @@ class KaraokeSettings:
     progress_bar_margin: int = 80
     progress_bar_bottom_offset: int = 60
 
+    # -- Encoding ------------------------------------------------------------
+    video_encoder: str = "auto"  # "auto" (hardware if available), "libx264", or any ffmpeg H.264 encoder
+
     # -- Theme ---------------------------------------------------------------
     theme: str = "dark"
 
@@ -9,19 +9,22 @@ Supports three input modes:
 
 from __future__ import annotations
 
+import os
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property, partial
 from pathlib import Path
 from typing import Callable, Optional
 
 from .config import KaraokeSettings
 from .tts import generate_tts, generate_tts_segment, concatenate_mp3_files
-from .align import get_word_timestamps
+from .align import get_word_timestamps, transcribe_with_timestamps
 from .transcribe import transcribe_audio
 from .render import render_video
 from .utils import (
-    clean_text, chunk_text, chunk_text_with_chapters,
-    map_whisper_words_to_chunks, get_audio_duration_seconds,
+    clean_text, chunk_and_map, get_audio_duration_seconds,
     extract_formatting, split_text_into_segments, split_audio_file,
 )
 
@@ -32,6 +35,24 @@ CHAPTER_PROCESSING_THRESHOLD = 5000
 AUDIO_CHUNK_DURATION = 600  # 10 minutes
 
 
+# Tag stripping for EPUB xhtml, done on raw bytes so markup is discarded
+# before anything is decoded.
+_TAG_RE_B = re.compile(rb"<[^>]+>")
+
+
+def _html_to_text(data: bytes) -> str:
+    """Strip tags from UTF-8 (x)html bytes and collapse whitespace."""
+    text = _TAG_RE_B.sub(b" ", data).decode("utf-8", errors="replace")
+    # Collapse after decoding: NBSP, em spaces and the like are whitespace
+    # too, and a bytes pattern only knows ASCII.
+    return " ".join(text.split())
+
+
+def _local_name(tag: str) -> str:
+    """Strip the ``{namespace}`` prefix from an ElementTree tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
 # ---------------------------------------------------------------------------
 # Pipeline result
 # ---------------------------------------------------------------------------
@@ -49,6 +70,11 @@ class PipelineResult:
     video_path: Optional[str] = None
     duration: float = 0.0
 
+    @cached_property
+    def word_count(self) -> int:
+        """Number of words in ``text``, counted once on first access."""
+        return len(self.text.split()) if self.text else 0
+
 
 # Type alias for the progress callback.
 # signature: callback(step: str, progress: float, message: str)
@@ -90,6 +116,7 @@ class Pipeline:
         self.output_path = output_path
         self.progress_callback = progress_callback
         self._epub_chapters = None
+        self._chapter_ranges = None
 
         self._validate_inputs()
 
@@ -171,7 +198,23 @@ class Pipeline:
 
     @staticmethod
     def _read_pdf(path: Path) -> str:
-        """Extract text from a PDF using pdftotext or fallback."""
+        """Extract text from a PDF in-process with PyMuPDF, or via pdftotext.
+
+        PyMuPDF is optional; when it isn't installed we shell out to
+        ``pdftotext`` as before.  Pages are extracted sequentially because
+        MuPDF documents must not be shared across threads.
+        """
+        try:
+            import pymupdf
+        except ImportError:
+            return Pipeline._read_pdf_pdftotext(path)
+
+        with pymupdf.open(str(path)) as doc:
+            return "\n".join(page.get_text("text") for page in doc)
+
+    @staticmethod
+    def _read_pdf_pdftotext(path: Path) -> str:
+        """Extract text from a PDF using the ``pdftotext`` command-line tool."""
         import subprocess
         result = subprocess.run(
             ["pdftotext", "-layout", str(path), "-"],
@@ -202,7 +245,6 @@ class Pipeline:
         cover pages and copyright notices.
         """
         import zipfile
-        import re
         import xml.etree.ElementTree as ET
 
         with zipfile.ZipFile(str(path), "r") as zf:
@@ -230,83 +272,74 @@ class Pipeline:
             if opf_dir == ".":
                 opf_dir = ""
 
-            # --- parse OPF manifest + spine ---
-            opf_xml = zf.read(opf_path).decode("utf-8", errors="replace")
-            opf_root = ET.fromstring(opf_xml)
-
-            # Detect default namespace
-            opf_ns = ""
-            m = re.match(r"\{(.+?)\}", opf_root.tag)
-            if m:
-                opf_ns = m.group(1)
-            ns = {"opf": opf_ns} if opf_ns else {}
-
-            def _find(parent, tag):
-                if ns:
-                    return parent.findall(f"opf:{tag}", ns)
-                return parent.findall(tag)
-
-            # Build id->href manifest map
-            manifest_el = opf_root.find(f"{{{opf_ns}}}manifest" if opf_ns else "manifest")
-            id_to_href: dict[str, str] = {}
-            if manifest_el is not None:
-                for item in _find(manifest_el, "item"):
-                    item_id = item.attrib.get("id", "")
-                    href = item.attrib.get("href", "")
-                    if item_id and href:
-                        id_to_href[item_id] = href
+            # --- parse OPF manifest + spine (streamed, no DOM kept) ---
+            manifest, spine_idrefs = Pipeline._parse_opf(zf.read(opf_path))
+            id_to_href = {
+                item["id"]: item["href"]
+                for item in manifest
+                if item["id"] and item["href"]
+            }
 
             # Spine reading order
-            spine_el = opf_root.find(f"{{{opf_ns}}}spine" if opf_ns else "spine")
             spine_hrefs: list[str] = []
-            if spine_el is not None:
-                for itemref in _find(spine_el, "itemref"):
-                    idref = itemref.attrib.get("idref", "")
-                    if idref in id_to_href:
-                        href = id_to_href[idref]
-                        full = f"{opf_dir}/{href}" if opf_dir else href
-                        spine_hrefs.append(full)
+            for idref in spine_idrefs:
+                if idref in id_to_href:
+                    href = id_to_href[idref]
+                    full = f"{opf_dir}/{href}" if opf_dir else href
+                    spine_hrefs.append(full)
 
             if not spine_hrefs:
                 return Pipeline._read_epub_flat(zf)
 
             # --- extract TOC titles ---
-            toc_titles = Pipeline._extract_toc_titles(zf, opf_root, opf_ns, opf_dir, ns)
+            toc_titles = Pipeline._extract_toc_titles(zf, manifest, opf_dir)
+
+            # --- read each spine file (in parallel, order preserved by map) ---
+            # Normalise path separators
+            hrefs = [href.replace("\\", "/") for href in spine_hrefs]
+            # Resolve every title up front: TOC entry, else derived from filename
+            title_of = {}
+            for href in hrefs:
+                if href not in title_of:
+                    stem = Path(href).stem
+                    title_of[href] = (
+                        toc_titles.get(href)
+                        or toc_titles.get(stem)
+                        or stem.replace("-", " ").replace("_", " ").title()
+                    )
+            read_one = partial(Pipeline._read_chapter, zf)
+            with ThreadPoolExecutor(max_workers=min(len(hrefs), os.cpu_count() or 1)) as pool:
+                chapters = [
+                    ch for ch in pool.map(read_one, hrefs, [title_of[h] for h in hrefs])
+                    if ch is not None
+                ]
 
-            # --- read each spine file ---
-            chapters: list[dict] = []
-            for href in spine_hrefs:
-                # Normalise path separators
-                href_norm = href.replace("\\", "/")
-                try:
-                    html = zf.read(href_norm).decode("utf-8", errors="replace")
-                except KeyError:
-                    continue
-
-                text = re.sub(r"<[^>]+>", " ", html)
-                text = re.sub(r"\s+", " ", text).strip()
+            return chapters if chapters else Pipeline._read_epub_flat(zf)
 
-                if len(text.split()) < 30:
-                    continue
+    @staticmethod
+    def _read_chapter(zf, href_norm: str, title: str) -> Optional[dict]:
+        """Read one spine entry and return ``{"title", "text"}``, or None to skip it.
 
-                # Try to find a title from TOC, else derive from filename
-                basename = Path(href_norm).stem
-                title = toc_titles.get(href_norm) or toc_titles.get(basename) or basename.replace("-", " ").replace("_", " ").title()
+        Safe to call from worker threads: ``ZipFile.read`` serialises access
+        to the underlying file and releases the GIL while decompressing.
+        """
+        try:
+            text = _html_to_text(zf.read(href_norm))
+        except KeyError:
+            return None
 
-                chapters.append({"title": title, "text": text})
+        if len(text.split()) < 30:
+            return None
 
-            return chapters if chapters else Pipeline._read_epub_flat(zf)
+        return {"title": title, "text": text}
 
     @staticmethod
     def _read_epub_flat(zf) -> list[dict]:
         """Fallback: read all xhtml files without chapter metadata."""
-        import re
         chapters = []
         for name in sorted(zf.namelist()):
             if name.endswith((".xhtml", ".html", ".htm")):
-                html = zf.read(name).decode("utf-8", errors="replace")
-                text = re.sub(r"<[^>]+>", " ", html)
-                text = re.sub(r"\s+", " ", text).strip()
+                text = _html_to_text(zf.read(name))
                 if text and len(text.split()) >= 30:
                     stem = Path(name).stem
                     title = stem.replace("-", " ").replace("_", " ").title()
@@ -314,51 +347,84 @@ class Pipeline:
         return chapters
 
     @staticmethod
-    def _extract_toc_titles(zf, opf_root, opf_ns, opf_dir, ns) -> dict[str, str]:
+    def _parse_opf(opf_xml: bytes) -> tuple[list[dict], list[str]]:
+        """Stream-parse an OPF package document.
+
+        Returns ``(manifest, spine_idrefs)`` where *manifest* is a list of
+        ``{"id", "href", "media_type", "properties"}`` dicts.  Elements are
+        cleared as soon as they're consumed so memory stays flat.
+        """
+        import io
+        import xml.etree.ElementTree as ET
+
+        manifest: list[dict] = []
+        spine_idrefs: list[str] = []
+        for _, el in ET.iterparse(io.BytesIO(opf_xml), events=("end",)):
+            tag = _local_name(el.tag)
+            if tag == "item":
+                manifest.append({
+                    "id": el.attrib.get("id", ""),
+                    "href": el.attrib.get("href", ""),
+                    "media_type": el.attrib.get("media-type", ""),
+                    "properties": el.attrib.get("properties", ""),
+                })
+                el.clear()
+            elif tag == "itemref":
+                spine_idrefs.append(el.attrib.get("idref", ""))
+                el.clear()
+        return manifest, spine_idrefs
+
+    @staticmethod
+    def _extract_toc_titles(zf, manifest: list[dict], opf_dir: str) -> dict[str, str]:
         """Extract href->title map from toc.ncx (EPUB2) or nav.xhtml (EPUB3)."""
+        import io
         import re
         import xml.etree.ElementTree as ET
 
         titles: dict[str, str] = {}
 
-        # --- Try toc.ncx (EPUB2) ---
-        def _find_opf(parent, tag):
-            if ns:
-                return parent.findall(f"opf:{tag}", ns)
-            return parent.findall(tag)
-
-        manifest_el = opf_root.find(f"{{{opf_ns}}}manifest" if opf_ns else "manifest")
+        # --- Locate toc.ncx / nav document in the manifest ---
         ncx_path = None
         nav_path = None
-        if manifest_el is not None:
-            for item in _find_opf(manifest_el, "item"):
-                href = item.attrib.get("href", "")
-                media = item.attrib.get("media-type", "")
-                props = item.attrib.get("properties", "")
-                if media == "application/x-dtbncx+xml":
-                    ncx_path = f"{opf_dir}/{href}" if opf_dir else href
-                if "nav" in props:
-                    nav_path = f"{opf_dir}/{href}" if opf_dir else href
+        for item in manifest:
+            href = item["href"]
+            if item["media_type"] == "application/x-dtbncx+xml":
+                ncx_path = f"{opf_dir}/{href}" if opf_dir else href
+            if "nav" in item["properties"]:
+                nav_path = f"{opf_dir}/{href}" if opf_dir else href
 
         # EPUB2: toc.ncx
         if ncx_path:
             try:
-                ncx_xml = zf.read(ncx_path).decode("utf-8", errors="replace")
-                ncx_root = ET.fromstring(ncx_xml)
-                ncx_ns_match = re.match(r"\{(.+?)\}", ncx_root.tag)
-                ncx_ns = ncx_ns_match.group(1) if ncx_ns_match else ""
-
-                for nav_point in ncx_root.iter(f"{{{ncx_ns}}}navPoint" if ncx_ns else "navPoint"):
-                    text_el = nav_point.find(f"{{{ncx_ns}}}navLabel/{{{ncx_ns}}}text" if ncx_ns else "navLabel/text")
-                    content_el = nav_point.find(f"{{{ncx_ns}}}content" if ncx_ns else "content")
+                # navPoints nest, so "end" arrives child-first.  Remember each
+                # navPoint's document position at "start" and apply titles in
+                # that order, so later entries win exactly as a pre-order walk.
+                entries: list[tuple[int, str, str]] = []
+                open_points: list[int] = []
+                seen = 0
+                for event, el in ET.iterparse(io.BytesIO(zf.read(ncx_path)), events=("start", "end")):
+                    if _local_name(el.tag) != "navPoint":
+                        continue
+                    if event == "start":
+                        open_points.append(seen)
+                        seen += 1
+                        continue
+                    order = open_points.pop()
+                    ns = el.tag[:el.tag.index("}") + 1] if el.tag.startswith("{") else ""
+                    text_el = el.find(f"{ns}navLabel/{ns}text")
+                    content_el = el.find(f"{ns}content")
                     if text_el is not None and content_el is not None and text_el.text:
                         src = content_el.attrib.get("src", "")
                         # Strip fragment
                         src = src.split("#")[0]
                         full = f"{opf_dir}/{src}" if opf_dir else src
-                        titles[full] = text_el.text.strip()
-                        # Also store by basename for fuzzy matching
-                        titles[Path(full).stem] = text_el.text.strip()
+                        entries.append((order, full, text_el.text.strip()))
+                    el.clear()
+
+                for _, full, title in sorted(entries):
+                    titles[full] = title
+                    # Also store by basename for fuzzy matching
+                    titles[Path(full).stem] = title
             except Exception:
                 pass
 
@@ -388,10 +454,17 @@ class Pipeline:
         return len(text.split()) >= CHAPTER_PROCESSING_THRESHOLD
 
     def _ensure_chapters(self, text: str) -> list[dict]:
-        """Return chapter list, auto-segmenting plain text if needed."""
-        if self._epub_chapters:
-            return self._epub_chapters
-        chapters = split_text_into_segments(text)
+        """Return chapter list, auto-segmenting plain text if needed.
+
+        Chapter text is stripped and empty chapters are dropped here, once,
+        so callers can iterate the result without re-checking.
+        """
+        chapters = self._epub_chapters or split_text_into_segments(text)
+        chapters = [
+            {**ch, "text": ch_text}
+            for ch in chapters
+            if (ch_text := ch["text"].strip())
+        ]
         # Store so build_chunks uses chapter-aware chunking
         self._epub_chapters = chapters
         return chapters
@@ -408,9 +481,7 @@ class Pipeline:
 
         for i, ch in enumerate(chapters):
             ch_label = ch.get("title", f"Chapter {i + 1}")
-            ch_text = ch["text"].strip()
-            if not ch_text:
-                continue
+            ch_text = ch["text"]
 
             # --- TTS for this chapter ---
             self._progress(
@@ -450,43 +521,26 @@ class Pipeline:
         # --- Chunk and map (same as single-pass) ---
         chunks, chunks_with_timings = self.build_chunks(text, all_whisper_words)
 
-        duration = get_audio_duration_seconds(final_audio)
+        # --- Render (optional, in the background) ---
+        wait_for_video = self._start_render(chunks_with_timings, final_audio)
+        try:
+            duration = get_audio_duration_seconds(final_audio)
+
+            # --- Formatting ---
+            formatting = {}
+            if hasattr(self, "_raw_text") and self._raw_text:
+                formatting = extract_formatting(self._raw_text)
 
-        # --- Render (optional) ---
-        video_path = None
-        if self.output_path:
-            video_path = self.render(chunks_with_timings, final_audio)
+            # --- Chapter timestamps ---
+            ch_timestamps = self._chapter_timestamps(chunks_with_timings, duration)
+        finally:
+            # Always collect the render, so it never runs on unobserved
+            # and its error surfaces even if the steps above failed
+            video_path = wait_for_video()
 
         elapsed = time.time() - t0
         self._progress("done", 1.0, f"Pipeline complete in {elapsed:.1f}s")
 
-        # --- Formatting ---
-        formatting = {}
-        if hasattr(self, "_raw_text") and self._raw_text:
-            formatting = extract_formatting(self._raw_text)
-
-        # --- Chapter timestamps ---
-        ch_timestamps = None
-        if self._chapter_ranges:
-            ch_timestamps = []
-            for cr in self._chapter_ranges:
-                start_chunk = cr["start_chunk"]
-                end_chunk = cr["end_chunk"]
-                start_time = 0.0
-                if start_chunk < len(chunks_with_timings) and chunks_with_timings[start_chunk]:
-                    start_time = chunks_with_timings[start_chunk][0].get("start", 0.0)
-                end_time = duration
-                if end_chunk < len(chunks_with_timings) and chunks_with_timings[end_chunk]:
-                    end_time = chunks_with_timings[end_chunk][-1].get("end", duration)
-                ch_timestamps.append({
-                    "title": cr["title"],
-                    "start_chunk": start_chunk,
-                    "end_chunk": end_chunk,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "word_count": cr["word_count"],
-                })
-
         return PipelineResult(
             text=text,
             audio_path=final_audio,
@@ -498,6 +552,38 @@ class Pipeline:
             duration=duration,
         )
 
+    def _chapter_timestamps(
+        self,
+        chunks_with_timings: list[list[dict]],
+        duration: float,
+    ) -> Optional[list[dict]]:
+        """Attach start/end times to ``self._chapter_ranges``.
+
+        A chapter starts at the first word of its first chunk and ends at the
+        last word of its last chunk.  Returns None when there are no chapters.
+        """
+        if not self._chapter_ranges:
+            return None
+
+        # Boundary times per chunk, computed once and indexed per chapter
+        starts = [c[0].get("start", 0.0) if c else 0.0 for c in chunks_with_timings]
+        ends = [c[-1].get("end", duration) if c else duration for c in chunks_with_timings]
+        n = len(chunks_with_timings)
+
+        chapters = []
+        for cr in self._chapter_ranges:
+            start_chunk = cr["start_chunk"]
+            end_chunk = cr["end_chunk"]
+            chapters.append({
+                "title": cr["title"],
+                "start_chunk": start_chunk,
+                "end_chunk": end_chunk,
+                "start_time": starts[start_chunk] if start_chunk < n else 0.0,
+                "end_time": ends[end_chunk] if end_chunk < n else duration,
+                "word_count": cr["word_count"],
+            })
+        return chapters
+
     # ------------------------------------------------------------------
     # Chunked audio processing (long audio uploads)
     # ------------------------------------------------------------------
@@ -548,23 +634,8 @@ class Pipeline:
                     i / total_seg,
                     f"Transcribing & aligning: {seg_label} ({i + 1}/{total_seg})",
                 )
-                import mlx_whisper
-                result = mlx_whisper.transcribe(
-                    seg_path,
-                    path_or_hf_repo="mlx-community/whisper-large-v3-turbo",
-                    word_timestamps=True,
-                )
-                seg_text = result.get("text", "").strip()
+                seg_text, seg_words = transcribe_with_timestamps(seg_path)
                 transcribed_parts.append(seg_text)
-
-                seg_words = []
-                for segment in result.get("segments", []):
-                    for w in segment.get("words", []):
-                        seg_words.append({
-                            "word": w["word"].strip(),
-                            "start": float(w["start"]),
-                            "end": float(w["end"]),
-                        })
                 print(f"[pipeline] {seg_label}: {len(seg_text.split())} words transcribed, {len(seg_words)} word timestamps")
             else:
                 # Text+audio: only need alignment
@@ -601,43 +672,26 @@ class Pipeline:
         # --- Chunk and map ---
         chunks, chunks_with_timings = self.build_chunks(text, all_whisper_words)
 
-        duration = get_audio_duration_seconds(audio_path)
+        # --- Render (optional, in the background) ---
+        wait_for_video = self._start_render(chunks_with_timings, audio_path)
+        try:
+            duration = get_audio_duration_seconds(audio_path)
 
-        # --- Render (optional) ---
-        video_path = None
-        if self.output_path:
-            video_path = self.render(chunks_with_timings, audio_path)
+            # --- Formatting ---
+            formatting = {}
+            if hasattr(self, "_raw_text") and self._raw_text:
+                formatting = extract_formatting(self._raw_text)
+
+            # --- Chapter timestamps ---
+            ch_timestamps = self._chapter_timestamps(chunks_with_timings, duration)
+        finally:
+            # Always collect the render, so it never runs on unobserved
+            # and its error surfaces even if the steps above failed
+            video_path = wait_for_video()
 
         elapsed = time.time() - t0
         self._progress("done", 1.0, f"Pipeline complete in {elapsed:.1f}s")
 
-        # --- Formatting ---
-        formatting = {}
-        if hasattr(self, "_raw_text") and self._raw_text:
-            formatting = extract_formatting(self._raw_text)
-
-        # --- Chapter timestamps ---
-        ch_timestamps = None
-        if self._chapter_ranges:
-            ch_timestamps = []
-            for cr in self._chapter_ranges:
-                start_chunk = cr["start_chunk"]
-                end_chunk = cr["end_chunk"]
-                start_time = 0.0
-                if start_chunk < len(chunks_with_timings) and chunks_with_timings[start_chunk]:
-                    start_time = chunks_with_timings[start_chunk][0].get("start", 0.0)
-                end_time = duration
-                if end_chunk < len(chunks_with_timings) and chunks_with_timings[end_chunk]:
-                    end_time = chunks_with_timings[end_chunk][-1].get("end", duration)
-                ch_timestamps.append({
-                    "title": cr["title"],
-                    "start_chunk": start_chunk,
-                    "end_chunk": end_chunk,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "word_count": cr["word_count"],
-                })
-
         return PipelineResult(
             text=text,
             audio_path=audio_path,  # Original file — no concatenation needed
@@ -690,6 +744,18 @@ class Pipeline:
         self._progress("align", 1.0, f"Aligned {len(whisper_words)} words")
         return whisper_words
 
+    def _chunker(self, text: str) -> Callable[[list[dict]], tuple[list[str], list[list[dict]], Optional[list[dict]]]]:
+        """Resolve the chunking source for this run once, arguments bound.
+
+        Chapter-aware chunking is used whenever chapters are known (EPUB or
+        auto-segmented long text); otherwise the flat text is chunked.
+        """
+        return partial(
+            chunk_and_map,
+            self._epub_chapters or text,
+            max_words_per_chunk=self.settings.max_words_per_chunk,
+        )
+
     def build_chunks(self, text: str, whisper_words: list[dict]) -> tuple[list[str], list[list[dict]]]:
         """Chunk text and map Whisper timestamps to chunks.
 
@@ -697,16 +763,7 @@ class Pipeline:
         """
         self._progress("chunk", 0.0, "Building display chunks...")
 
-        if self._epub_chapters:
-            chunks, self._chapter_ranges = chunk_text_with_chapters(
-                self._epub_chapters,
-                max_words_per_chunk=self.settings.max_words_per_chunk,
-            )
-        else:
-            chunks = chunk_text(text, max_words_per_chunk=self.settings.max_words_per_chunk)
-            self._chapter_ranges = None
-
-        chunks_with_timings = map_whisper_words_to_chunks(chunks, whisper_words)
+        chunks, chunks_with_timings, self._chapter_ranges = self._chunker(text)(whisper_words)
 
         self._progress("chunk", 1.0, f"Created {len(chunks)} chunks")
         return chunks, chunks_with_timings
@@ -733,6 +790,23 @@ class Pipeline:
         self._progress("render", 1.0, "Video rendered")
         return video_path
 
+    def _start_render(
+        self, chunks_with_timings: list[list[dict]], audio_path: str,
+    ) -> Callable[[], Optional[str]]:
+        """Start :meth:`render` on a background thread if an output is set.
+
+        Returns a callable that waits for the render and gives the video
+        path (or None when no video was requested), so duration probing and
+        formatting extraction overlap with encoding. Callers must invoke it
+        in a ``finally`` so a failure in between still joins the render.
+        """
+        if not self.output_path:
+            return lambda: None
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+        future = pool.submit(self.render, chunks_with_timings, audio_path)
+        pool.shutdown(wait=False)
+        return future.result
+
     # ------------------------------------------------------------------
     # Full run
     # ------------------------------------------------------------------
@@ -788,48 +862,29 @@ class Pipeline:
 
         chunks, chunks_with_timings = self.build_chunks(text, whisper_words)
 
-        # -- Audio duration ------------------------------------------------
+        # -- Render (optional, in the background) --------------------------
+
+        wait_for_video = self._start_render(chunks_with_timings, audio_path)
+        try:
+            # -- Audio duration --------------------------------------------
 
-        duration = get_audio_duration_seconds(audio_path)
+            duration = get_audio_duration_seconds(audio_path)
 
-        # -- Render (optional) ---------------------------------------------
+            # -- Formatting map --------------------------------------------
+            formatting = {}
+            if hasattr(self, "_raw_text") and self._raw_text:
+                formatting = extract_formatting(self._raw_text)
 
-        video_path = None
-        if self.output_path:
-            video_path = self.render(chunks_with_timings, audio_path)
+            # -- Chapter timestamps ----------------------------------------
+            chapters = self._chapter_timestamps(chunks_with_timings, duration)
+        finally:
+            # Always collect the render, so it never runs on unobserved
+            # and its error surfaces even if the steps above failed
+            video_path = wait_for_video()
 
         elapsed = time.time() - t0
         self._progress("done", 1.0, f"Pipeline complete in {elapsed:.1f}s")
 
-        # -- Formatting map ------------------------------------------------
-        formatting = {}
-        if hasattr(self, "_raw_text") and self._raw_text:
-            formatting = extract_formatting(self._raw_text)
-
-        # -- Chapter timestamps --------------------------------------------
-        chapters = None
-        if self._chapter_ranges:
-            chapters = []
-            for cr in self._chapter_ranges:
-                start_chunk = cr["start_chunk"]
-                end_chunk = cr["end_chunk"]
-                # First word of first chunk in chapter
-                start_time = 0.0
-                if start_chunk < len(chunks_with_timings) and chunks_with_timings[start_chunk]:
-                    start_time = chunks_with_timings[start_chunk][0].get("start", 0.0)
-                # Last word of last chunk in chapter
-                end_time = duration
-                if end_chunk < len(chunks_with_timings) and chunks_with_timings[end_chunk]:
-                    end_time = chunks_with_timings[end_chunk][-1].get("end", duration)
-                chapters.append({
-                    "title": cr["title"],
-                    "start_chunk": start_chunk,
-                    "end_chunk": end_chunk,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "word_count": cr["word_count"],
-                })
-
         return PipelineResult(
             text=text,
             audio_path=audio_path,
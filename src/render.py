@@ -4,10 +4,19 @@ Karaoke video renderer.
 Generates frames with PIL/Pillow and assembles them into a video with ffmpeg.
 """
 
+import multiprocessing
 import os
+import queue
 import subprocess
 import tempfile
-import shutil
+import threading
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
@@ -51,15 +60,32 @@ class TextLayout:
         self.line_spacing = line_spacing
         self.max_text_width = width - 2 * margin_x
 
+        # Word widths are sums of per-character advances, so FreeType is
+        # asked once per distinct character rather than once per word.
+        # Kerning is ignored, which shifts a few words by a pixel or two.
+        self._advance: dict[str, float] = {}
+        self._size_cache: dict[str, tuple[int, int]] = {}
+        bbox = font.getbbox("Hg")
+        self._char_h = bbox[3] - bbox[1]  # representative height
+        self._space_w = self.get_word_size(" ")[0]
+
     def get_word_size(self, word: str) -> tuple[int, int]:
-        """Get the pixel dimensions of a word."""
-        bbox = self.font.getbbox(word)
-        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+        """Get the pixel dimensions of a word (height is the line's glyph height)."""
+        size = self._size_cache.get(word)
+        if size is None:
+            advance = self._advance
+            width = 0.0
+            for ch in word:
+                w = advance.get(ch)
+                if w is None:
+                    w = advance[ch] = self.font.getlength(ch)
+                width += w
+            size = self._size_cache[word] = (round(width), self._char_h)
+        return size
 
     def get_space_width(self) -> int:
         """Get the pixel width of a space character."""
-        bbox = self.font.getbbox(" ")
-        return bbox[2] - bbox[0]
+        return self._space_w
 
     def layout_words(self, words: list[str]) -> list[list[tuple[str, int, int]]]:
         """
@@ -96,8 +122,7 @@ class TextLayout:
         """Calculate total height of a text block."""
         if not lines:
             return 0
-        _, h = self.get_word_size("Hg")  # representative height
-        line_h = int(h * self.line_spacing)
+        line_h = int(self._char_h * self.line_spacing)
         return line_h * len(lines)
 
     def get_vertical_offset(self, lines: list) -> int:
@@ -106,6 +131,86 @@ class TextLayout:
         # Center vertically, but bias slightly upward
         return max(self.margin_top, (self.height - block_h) // 2 - 40)
 
+    def position_words(self, words: list[str]) -> list[tuple[str, int, int, int]]:
+        """
+        Lay out words and resolve their absolute frame coordinates.
+
+        Lines are centered horizontally and the block vertically. Returns a
+        flat list of (word, x, y, word_index_in_input) tuples. The result is
+        constant for a given chunk, so it can be computed once and reused for
+        every frame the chunk is on screen.
+        """
+        lines = self.layout_words(words)
+        y_start = self.get_vertical_offset(lines)
+        line_h = int(self._char_h * self.line_spacing)
+
+        positions = []
+        for line_idx, line in enumerate(lines):
+            y = y_start + line_idx * line_h
+
+            # Center the line horizontally
+            last_word, last_x, _ = line[-1]
+            line_width = last_x + self.get_word_size(last_word)[0]
+            x_offset = (self.width - line_width) // 2
+
+            for word, x, word_idx in line:
+                positions.append((word, x_offset + x, y, word_idx))
+
+        return positions
+
+
+class GlyphCache:
+    """
+    Rasterized word masks, so each word goes through FreeType only once.
+
+    A word is rendered once as an "L" coverage mask; drawing it is then a
+    single bitmap blit with any fill color, which also covers every fade
+    level without caching one tile per color.
+    """
+
+    def __init__(self, font: ImageFont.FreeTypeFont):
+        self.font = font
+        self._masks: dict[str, tuple[Image.Image, int, int] | None] = {}
+
+    def get(self, word: str) -> tuple[Image.Image, int, int] | None:
+        """Return (mask, dx, dy) for a word, or None if it has no ink."""
+        try:
+            return self._masks[word]
+        except KeyError:
+            pass
+        left, top, right, bottom = self.font.getbbox(word)
+        entry = None
+        if right > left and bottom > top:
+            mask = Image.new("L", (right - left, bottom - top), 0)
+            ImageDraw.Draw(mask).text((-left, -top), word, fill=255, font=self.font)
+            entry = (mask, left, top)
+        self._masks[word] = entry
+        return entry
+
+    def draw(self, draw: ImageDraw.ImageDraw, xy: tuple[int, int], word: str, fill) -> None:
+        """Equivalent to ``draw.text(xy, word, fill=fill, font=self.font)``."""
+        entry = self.get(word)
+        if entry is not None:
+            mask, dx, dy = entry
+            draw.bitmap((xy[0] + dx, xy[1] + dy), mask, fill=fill)
+
+
+@lru_cache(maxsize=8)
+def _font(font_size: int) -> ImageFont.FreeTypeFont:
+    """Load the render font once per process and size."""
+    return find_font(font_size)
+
+
+@lru_cache(maxsize=4)
+def _get_layout(
+    font_size: int, width: int, height: int, margin_x: int, line_spacing: float
+) -> TextLayout:
+    """
+    Shared TextLayout per geometry, so repeated renders in one process
+    (e.g. the web server) keep its warmed character-width caches.
+    """
+    return TextLayout(width, height, _font(font_size), margin_x=margin_x, line_spacing=line_spacing)
+
 
 # ---------------------------------------------------------------------------
 # Frame renderer
@@ -122,6 +227,8 @@ def render_frame(
     height: int,
     fade_alpha: float = 1.0,
     settings=None,
+    positions: list[tuple[str, int, int, int]] | None = None,
+    glyphs: GlyphCache | None = None,
 ) -> None:
     """
     Render a single karaoke frame onto an ImageDraw surface.
@@ -139,101 +246,675 @@ def render_frame(
         settings: Optional KaraokeSettings instance. When provided, colors
             and progress bar dimensions are taken from settings instead of
             the module-level COLOR_* constants.
+        positions: Optional precomputed ``layout.position_words(chunk_words)``
+            result. Computed here when omitted.
+        glyphs: Optional GlyphCache for ``layout.font``. When provided, words
+            are blitted from cached masks instead of rasterized per call.
     """
-    # Resolve colors — settings override hardcoded constants
-    if settings is not None:
-        color_bg = settings.bg_rgb
-        color_highlight = settings.highlight_rgb
-        color_spoken = settings.spoken_rgb
-        color_upcoming = settings.upcoming_rgb
-        color_progress_bg = settings.progress_bg_rgb
-        color_progress_fg = settings.progress_fg_rgb
-        bar_height = settings.progress_bar_height
-        bar_bottom_offset = settings.progress_bar_bottom_offset
-        bar_margin = settings.progress_bar_margin
-    else:
-        color_bg = COLOR_BG
-        color_highlight = COLOR_HIGHLIGHT
-        color_spoken = COLOR_SPOKEN
-        color_upcoming = COLOR_UPCOMING
-        color_progress_bg = COLOR_PROGRESS_BG
-        color_progress_fg = COLOR_PROGRESS_FG
-        bar_height = 4
-        bar_bottom_offset = 60
-        bar_margin = 80
+    style = _Style.from_settings(settings)
 
     # Background
-    draw.rectangle([0, 0, width, height], fill=color_bg)
+    draw.rectangle([0, 0, width, height], fill=style.bg)
 
     if not chunk_words:
         return
 
-    # Lay out words into lines
-    lines = layout.layout_words(chunk_words)
-    y_start = layout.get_vertical_offset(lines)
+    if positions is None:
+        positions = layout.position_words(chunk_words)
 
-    _, char_h = layout.get_word_size("Hg")
-    line_h = int(char_h * layout.line_spacing)
+    for word, x, y, word_idx in positions:
+        color = _word_color(chunk_timings, word_idx, current_time, fade_alpha, style)
+        if glyphs is not None:
+            glyphs.draw(draw, (x, y), word, color)
+        else:
+            draw.text((x, y), word, fill=color, font=layout.font)
+
+    _draw_progress_bar(draw, style, progress, width, height)
+
+
+@dataclass(frozen=True)
+class _Style:
+    """Resolved colors and progress bar geometry for one render."""
+
+    bg: tuple[int, int, int] = COLOR_BG
+    highlight: tuple[int, int, int] = COLOR_HIGHLIGHT
+    spoken: tuple[int, int, int] = COLOR_SPOKEN
+    upcoming: tuple[int, int, int] = COLOR_UPCOMING
+    progress_bg: tuple[int, int, int] = COLOR_PROGRESS_BG
+    progress_fg: tuple[int, int, int] = COLOR_PROGRESS_FG
+    bar_height: int = 4
+    bar_bottom_offset: int = 60
+    bar_margin: int = 80
+
+    @classmethod
+    def from_settings(cls, settings) -> "_Style":
+        """Settings override the module-level COLOR_* constants when given."""
+        if settings is None:
+            return cls()
+        return cls(
+            bg=settings.bg_rgb,
+            highlight=settings.highlight_rgb,
+            spoken=settings.spoken_rgb,
+            upcoming=settings.upcoming_rgb,
+            progress_bg=settings.progress_bg_rgb,
+            progress_fg=settings.progress_fg_rgb,
+            bar_height=settings.progress_bar_height,
+            bar_bottom_offset=settings.progress_bar_bottom_offset,
+            bar_margin=settings.progress_bar_margin,
+        )
 
-    for line_idx, line in enumerate(lines):
-        y = y_start + line_idx * line_h
 
-        # Center the line horizontally
-        if line:
-            last_word, last_x, _ = line[-1]
-            last_w, _ = layout.get_word_size(last_word)
-            line_width = last_x + last_w
-            x_offset = (width - line_width) // 2
-        else:
-            x_offset = layout.margin_x
-
-        for word, x, word_idx in line:
-            # Determine word color based on timing
-            if word_idx < len(chunk_timings):
-                timing = chunk_timings[word_idx]
-                word_start = timing["start"]
-                word_end = timing["end"]
-
-                if current_time >= word_start and current_time < word_end:
-                    # Currently being spoken
-                    color = color_highlight
-                elif current_time >= word_end:
-                    # Already spoken
-                    color = color_spoken
-                else:
-                    # Not yet spoken
-                    color = color_upcoming
-            else:
-                color = color_upcoming
-
-            # Apply fade alpha
-            if fade_alpha < 1.0:
-                color = tuple(int(c * fade_alpha) for c in color)
-
-            draw.text((x_offset + x, y), word, fill=color, font=layout.font)
-
-    # Progress bar at bottom
-    bar_y = height - bar_bottom_offset
-    bar_width = width - 2 * bar_margin
+# Word states, as returned by _word_state
+UPCOMING, HIGHLIGHT, SPOKEN = 0, 1, 2
+
+
+def _word_state(chunk_timings: list[dict], word_idx: int, current_time: float) -> int:
+    """Whether a word is upcoming, being spoken, or spoken at *current_time*."""
+    if word_idx < len(chunk_timings):
+        timing = chunk_timings[word_idx]
+        word_start = timing["start"]
+        word_end = timing["end"]
+
+        if current_time >= word_start and current_time < word_end:
+            # Currently being spoken
+            return HIGHLIGHT
+        elif current_time >= word_end:
+            # Already spoken
+            return SPOKEN
+    # Not yet spoken
+    return UPCOMING
+
+
+def _word_color(
+    chunk_timings: list[dict],
+    word_idx: int,
+    current_time: float,
+    fade_alpha: float,
+    style: _Style,
+) -> tuple[int, int, int]:
+    """Color of a word at *current_time*, with the fade applied."""
+    state = _word_state(chunk_timings, word_idx, current_time)
+    return _faded((style.upcoming, style.highlight, style.spoken)[state], fade_alpha)
+
+
+def _faded(color: tuple[int, int, int], fade_alpha: float) -> tuple[int, int, int]:
+    """Apply a fade transition's opacity to a color."""
+    if fade_alpha < 1.0:
+        return tuple(int(c * fade_alpha) for c in color)
+    return color
+
+
+# State lookup by (t >= start) + 2 * (t >= end), matching _word_state
+_STATE_LUT = (UPCOMING, HIGHLIGHT, SPOKEN, SPOKEN)
+
+
+def _draw_progress_bar(
+    draw: ImageDraw.ImageDraw, style: _Style, progress: float, width: int, height: int,
+) -> None:
+    """Draw the progress bar at the bottom of the frame."""
+    x0, y0, x1, y1 = _progress_bar_box(style, width, height)
 
     # Background bar
-    draw.rectangle(
-        [bar_margin, bar_y, bar_margin + bar_width, bar_y + bar_height],
-        fill=color_progress_bg,
-    )
+    draw.rectangle([x0, y0, x1, y1], fill=style.progress_bg)
     # Fill bar
-    fill_width = int(bar_width * progress)
+    fill_width = _progress_fill_width(style, progress, width)
     if fill_width > 0:
-        draw.rectangle(
-            [bar_margin, bar_y, bar_margin + fill_width, bar_y + bar_height],
-            fill=color_progress_fg,
+        draw.rectangle([x0, y0, x0 + fill_width, y1], fill=style.progress_fg)
+
+
+def _advance_progress_bar(
+    draw: ImageDraw.ImageDraw,
+    style: _Style,
+    drawn: int | None,
+    fill_width: int,
+    width: int,
+    height: int,
+) -> int:
+    """
+    Bring a bar last drawn with *drawn* fill pixels up to *fill_width*.
+
+    Only the newly filled slice is painted; a full redraw happens when the
+    bar is missing (*drawn* is None) or would shrink. Returns the new fill.
+    """
+    x0, y0, x1, y1 = _progress_bar_box(style, width, height)
+    if drawn is None or fill_width < drawn:
+        draw.rectangle([x0, y0, x1, y1], fill=style.progress_bg)
+        drawn = 0
+    if fill_width > drawn:
+        draw.rectangle([x0 + drawn, y0, x0 + fill_width, y1], fill=style.progress_fg)
+    return fill_width
+
+
+def _progress_bar_box(style: _Style, width: int, height: int) -> tuple[int, int, int, int]:
+    """Inclusive (x0, y0, x1, y1) of the whole progress bar."""
+    bar_y = height - style.bar_bottom_offset
+    return (
+        style.bar_margin,
+        bar_y,
+        width - style.bar_margin,
+        bar_y + style.bar_height,
+    )
+
+
+def _progress_fill_width(style: _Style, progress: float, width: int) -> int:
+    """Pixel width of the filled part of the progress bar."""
+    return int((width - 2 * style.bar_margin) * progress)
+
+
+class _ChunkCanvas:
+    """
+    Text layer for the chunk on screen, updated in place between frames.
+
+    Consecutive frames usually differ by at most one word's color, so only
+    words whose color changed are cleared and re-blitted. Words with
+    overlapping ink boxes form a group that is always repainted together,
+    in layout order, so the layer matches drawing the chunk from scratch.
+
+    The canvas draws into a caller-owned frame buffer, which it clears to
+    the background on creation.
+    """
+
+    def __init__(
+        self,
+        img: Image.Image,
+        draw: ImageDraw.ImageDraw,
+        bg: tuple[int, int, int],
+        chunk: "_ChunkData",
+        glyphs: GlyphCache,
+        bar_box: tuple[int, int, int, int],
+    ):
+        img.paste(bg, (0, 0, *img.size))
+        self.img = img
+        self.draw = draw
+        self._bg = bg
+        # Progress bar fill currently on the canvas (None: needs full draw)
+        self.bar_fill: int | None = None
+        self._states: tuple[int, ...] | None = None
+        self._palette: tuple | None = None
+
+        # Resolved (mask, top-left) blit and inclusive ink box per word,
+        # None for words with no ink
+        self._blits = []
+        self._boxes = []
+        for word, x, y in zip(chunk.words, chunk.xs, chunk.ys):
+            entry = glyphs.get(word)
+            if entry is None:
+                self._blits.append(None)
+                self._boxes.append(None)
+                continue
+            mask, dx, dy = entry
+            x0, y0 = x + dx, y + dy
+            self._blits.append((mask, (x0, y0)))
+            self._boxes.append((x0, y0, x0 + mask.width - 1, y0 + mask.height - 1))
+
+        # Group words whose boxes overlap, directly or through a neighbour
+        n = len(chunk.words)
+        self._group_of = list(range(n))
+        self._groups = [[i] for i in range(n)]
+        for i in range(n):
+            for j in range(i + 1, n):
+                gi, gj = self._group_of[i], self._group_of[j]
+                if gi != gj and self._overlaps(self._boxes[i], self._boxes[j]):
+                    self._groups[gi] = sorted(self._groups[gi] + self._groups[gj])
+                    for k in self._groups[gj]:
+                        self._group_of[k] = gi
+                    self._groups[gj] = []
+
+        # Groups whose repaint clears part of the progress bar
+        self._hits_bar = {
+            self._group_of[i] for i in range(n) if self._overlaps(self._boxes[i], bar_box)
+        }
+
+    @staticmethod
+    def _overlaps(a, b) -> bool:
+        return (
+            a is not None and b is not None
+            and a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+        )
+
+    def update(self, states: tuple[int, ...], palette: tuple) -> None:
+        """
+        Repaint the words whose color differs from the last update.
+
+        Words carry palette indices (their UPCOMING/HIGHLIGHT/SPOKEN state)
+        rather than colors; *palette* maps each index to an RGB fill. A new
+        palette, as during a fade, recolors every word.
+        """
+        if palette != self._palette:
+            dirty = set(self._group_of)
+        elif states == self._states:
+            return
+        else:
+            old = self._states
+            dirty = {self._group_of[i] for i, st in enumerate(states) if st != old[i]}
+        self._states = states
+        self._palette = palette
+
+        if not dirty.isdisjoint(self._hits_bar):
+            self.bar_fill = None
+
+        draw = self.draw
+        for g in sorted(dirty):
+            members = self._groups[g]
+            for i in members:
+                if self._boxes[i] is not None:
+                    draw.rectangle(self._boxes[i], fill=self._bg)
+            for i in members:
+                blit = self._blits[i]
+                if blit is not None:
+                    draw.bitmap(blit[1], blit[0], fill=palette[states[i]])
+
+
+# ---------------------------------------------------------------------------
+# Frame workers
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class _ChunkData:
+    """
+    One chunk, laid out, as parallel per-word lists (structure of arrays).
+
+    Index i of every list describes the same word, in layout order. Workers
+    get these instead of the timing dicts, so per-frame loops zip flat
+    lists rather than chasing dict keys.
+    """
+
+    words: list[str]
+    xs: list[int]
+    ys: list[int]
+    starts: list[float]
+    ends: list[float]
+
+    @classmethod
+    def build(cls, layout: TextLayout, chunk: list[dict]) -> "_ChunkData":
+        positions = layout.position_words([w["word"] for w in chunk])
+        return cls(
+            words=[word for word, _, _, _ in positions],
+            xs=[x for _, x, _, _ in positions],
+            ys=[y for _, _, y, _ in positions],
+            starts=[chunk[idx]["start"] for _, _, _, idx in positions],
+            ends=[chunk[idx]["end"] for _, _, _, idx in positions],
+        )
+
+
+@dataclass
+class _RenderContext:
+    """Everything a worker process needs to render any frame of the video."""
+
+    chunks: list[_ChunkData]
+    chunk_ranges: list[tuple[float, float]]
+    audio_duration: float
+    width: int
+    height: int
+    fps: int
+    font_size: int
+    style: _Style
+    settings: object = None
+    # Active chunk per frame (-1 for none), filled by index_frames()
+    frame_chunk: array = None
+    # Raw frame format on the ffmpeg pipe: "yuv420p" or "rgb24"
+    pix_fmt: str = "rgb24"
+
+    def rolls(self, chunk_idx: int) -> tuple[float, float]:
+        """(pre_roll, post_roll) around a chunk's words."""
+        settings = self.settings
+        # Add some pre-roll so text appears slightly before the words start
+        pre_roll = settings.pre_roll if settings is not None else 0.3
+        # Add post-roll so text stays briefly after last word
+        base_post_roll = settings.post_roll if settings is not None else 0.3
+        post_roll = base_post_roll if chunk_idx < len(self.chunk_ranges) - 1 else 1.0
+        return pre_roll, post_roll
+
+    def index_frames(self, total_frames: int) -> None:
+        """
+        Resolve the active chunk of every frame once, up front.
+
+        A frame shows the first chunk whose [start - pre_roll, end +
+        post_roll] window contains it, so chunks are written last to first
+        and earlier ones win overlaps. Window edges are settled with the
+        same float comparisons the per-frame check used.
+        """
+        fps = self.fps
+        frame_chunk = array("i", [-1]) * total_frames
+        for ci in range(len(self.chunk_ranges) - 1, -1, -1):
+            cs, ce = self.chunk_ranges[ci]
+            pre_roll, post_roll = self.rolls(ci)
+            lo, hi = cs - pre_roll, ce + post_roll
+
+            f0 = max(0, int((lo * fps)) - 1)
+            while f0 < total_frames and not f0 / fps >= lo:
+                f0 += 1
+            f1 = min(total_frames - 1, int(hi * fps) + 1)
+            while f1 >= f0 and not f1 / fps <= hi:
+                f1 -= 1
+            if f1 >= f0:
+                frame_chunk[f0:f1 + 1] = array("i", [ci]) * (f1 + 1 - f0)
+        self.frame_chunk = frame_chunk
+
+    def frame_timing(self, frame_idx: int) -> tuple[float, float, int | None, float]:
+        """Return (current_time, progress, active_chunk_idx, fade_alpha) for a frame."""
+        current_time = frame_idx / self.fps
+        progress = current_time / self.audio_duration if self.audio_duration > 0 else 0
+
+        ci = self.frame_chunk[frame_idx]
+        if ci < 0:
+            return current_time, progress, None, 1.0
+
+        cs, ce = self.chunk_ranges[ci]
+        pre_roll, post_roll = self.rolls(ci)
+        # Fade in
+        if current_time < cs:
+            fade_alpha = max(0.0, 1.0 - (cs - current_time) / pre_roll)
+        # Fade out
+        elif current_time > ce:
+            fade_alpha = max(0.0, 1.0 - (current_time - ce) / post_roll)
+        else:
+            fade_alpha = 1.0
+
+        return current_time, progress, ci, fade_alpha
+
+    def frame_key(self, frame_idx: int) -> tuple:
+        """A value that is equal for two frames exactly when their pixels are.
+
+        Cheap to compute (no drawing), so duplicates can be found up front.
+        """
+        current_time, progress, ci, fade_alpha = self.frame_timing(frame_idx)
+        if ci is None:
+            return (None, _progress_fill_width(self.style, progress, self.width))
+        if not self.chunks[ci].words:
+            return (ci,)
+        states = self.word_states(ci, current_time)
+        return (ci, fade_alpha, states, _progress_fill_width(self.style, progress, self.width))
+
+    def word_states(self, chunk_idx: int, current_time: float) -> tuple[int, ...]:
+        """State of every positioned word of a chunk, without per-word branching."""
+        chunk = self.chunks[chunk_idx]
+        starts, ends = chunk.starts, chunk.ends
+        lut = _STATE_LUT
+        return tuple(
+            lut[(current_time >= s) + 2 * (current_time >= e)]
+            for s, e in zip(starts, ends)
         )
 
 
+def _frame_runs(ctx: _RenderContext, total_frames: int) -> list[tuple[int, int]]:
+    """Collapse consecutive identical frames into (first_frame_idx, count) runs."""
+    runs = []
+    last_key = object()
+    for frame_idx in range(total_frames):
+        key = ctx.frame_key(frame_idx)
+        if key == last_key:
+            first, count = runs[-1]
+            runs[-1] = (first, count + 1)
+        else:
+            runs.append((frame_idx, 1))
+            last_key = key
+    return runs
+
+
+# _FrameRenderer._shown value for a text-less frame with the progress bar
+_BLANK = -1
+
+
+class _FrameRenderer:
+    """Per-worker rendering state: glyph cache and the chunk canvas."""
+
+    def __init__(self, ctx: _RenderContext):
+        self.ctx = ctx
+        self.style = ctx.style
+        self._palette = (self.style.upcoming, self.style.highlight, self.style.spoken)
+        self.glyphs = GlyphCache(_font(ctx.font_size))
+        self._canvas: _ChunkCanvas | None = None
+        # One frame buffer for the whole render. _shown is what it holds:
+        # a chunk index, _BLANK (background and progress bar) or None
+        # (background only).
+        self._img = Image.new("RGB", (ctx.width, ctx.height), self.style.bg)
+        self._draw = ImageDraw.Draw(self._img)
+        self._shown: int | None = None
+        self._blank_bar_fill: int | None = None
+
+    def render(self, frame_idx: int) -> Image.Image:
+        """
+        Render video frame *frame_idx*.
+
+        Frames are drawn into one persistent buffer rather than fresh images,
+        so the result is only valid until the next call. The progress bar is
+        painted straight onto the buffer, last, as in render_frame; only
+        its newly filled pixels are drawn unless text repaints touched it.
+        """
+        ctx = self.ctx
+        style = self.style
+        width, height = ctx.width, ctx.height
+
+        current_time, progress, active_chunk_idx, fade_alpha = ctx.frame_timing(frame_idx)
+        fill_width = _progress_fill_width(style, progress, width)
+
+        if active_chunk_idx is None:
+            # Empty frame (between chunks or before/after audio), still with
+            # the progress bar
+            if self._shown != _BLANK:
+                self._clear(_BLANK)
+                self._blank_bar_fill = None
+            self._blank_bar_fill = _advance_progress_bar(
+                self._draw, style, self._blank_bar_fill, fill_width, width, height,
+            )
+            return self._img
+
+        if not ctx.chunks[active_chunk_idx].words:
+            # Same as render_frame: nothing but background for an empty chunk
+            if self._shown is not None:
+                self._clear(None)
+            return self._img
+
+        palette = self._palette
+        if fade_alpha < 1.0:
+            palette = tuple(_faded(c, fade_alpha) for c in palette)
+        canvas = self._canvas_for(active_chunk_idx)
+        canvas.update(ctx.word_states(active_chunk_idx, current_time), palette)
+        canvas.bar_fill = _advance_progress_bar(
+            canvas.draw, style, canvas.bar_fill, fill_width, width, height,
+        )
+        return canvas.img
+
+    def _canvas_for(self, chunk_idx: int) -> _ChunkCanvas:
+        """Canvas of *chunk_idx*, starting a fresh one on chunk change."""
+        if chunk_idx != self._shown:
+            self._canvas = _ChunkCanvas(
+                self._img,
+                self._draw,
+                self.style.bg,
+                self.ctx.chunks[chunk_idx],
+                self.glyphs,
+                _progress_bar_box(self.style, self.ctx.width, self.ctx.height),
+            )
+            self._shown = chunk_idx
+        return self._canvas
+
+    def _clear(self, shown: int | None) -> None:
+        """Repaint the frame buffer with plain background."""
+        self._img.paste(self.style.bg, (0, 0, self.ctx.width, self.ctx.height))
+        self._canvas = None
+        self._shown = shown
+
+
+# Per-process renderer, set once by _init_worker
+_renderer: _FrameRenderer | None = None
+
+
+def _init_worker(ctx: _RenderContext) -> None:
+    """Process-pool initializer: load the font and build state once."""
+    global _renderer
+    _renderer = _FrameRenderer(ctx)
+
+
+# RGB -> BT.601 limited-range Y'CbCr, the conversion ffmpeg itself applies
+# to rgb24 input when encoding yuv420p
+_YUV_MATRIX = (
+    0.256788, 0.504129, 0.097906, 16,
+    -0.148223, -0.290993, 0.439216, 128,
+    0.439216, -0.367788, -0.071427, 128,
+)
+
+
+def _yuv420p_bytes(img: Image.Image) -> bytes:
+    """Planar 4:2:0 frame data (Y, then U and V at half size) for ffmpeg."""
+    y, u, v = img.convert("RGB", _YUV_MATRIX).split()
+    return y.tobytes() + u.reduce(2).tobytes() + v.reduce(2).tobytes()
+
+
+def _render_frames(frame_indices: list[int]) -> list[bytes]:
+    """Render the given frames, in order, as raw bytes in the pipe format."""
+    if _renderer.ctx.pix_fmt == "yuv420p":
+        return [_yuv420p_bytes(_renderer.render(frame_idx)) for frame_idx in frame_indices]
+    return [_renderer.render(frame_idx).tobytes() for frame_idx in frame_indices]
+
+
+class _PipeWriter:
+    """
+    Feeds frames to ffmpeg's stdin from a background thread.
+
+    A small bounded queue decouples rendering from encoding: an encoder
+    stall no longer stops the main thread from collecting and submitting
+    work, and a slow batch no longer leaves ffmpeg waiting. Eight 1080x1920
+    frames are about 25 MB as yuv420p (50 MB as RGB).
+    """
+
+    def __init__(self, stream, maxsize: int = 8):
+        self._stream = stream
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.broken = False  # set once ffmpeg stops reading
+        self._thread = threading.Thread(target=self._run, name="ffmpeg-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, data: bytes, count: int = 1) -> None:
+        """Queue a frame to be written *count* times, blocking while full."""
+        self._queue.put((data, count))
+
+    def close(self) -> None:
+        """Write out everything queued, then close the stream."""
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            self._stream.close()
+        except OSError:
+            self.broken = True
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            if self.broken:
+                continue  # keep draining so producers never block
+            data, count = item
+            try:
+                for _ in range(count):
+                    self._stream.write(data)
+            except OSError:
+                self.broken = True
+
+
+# ---------------------------------------------------------------------------
+# Video encoder selection
+# ---------------------------------------------------------------------------
+
+# Quality arguments per H.264 encoder; hardware ones in "auto" preference order
+_ENCODER_ARGS = {
+    "h264_videotoolbox": ["-q:v", "55"],
+    "h264_nvenc": ["-preset", "p4", "-cq", "23"],
+    "h264_qsv": ["-global_quality", "23"],
+    "libx264": ["-preset", "medium", "-crf", "23"],
+}
+
+
+@lru_cache(maxsize=None)
+def _hardware_encoder() -> str | None:
+    """
+    Return the first hardware H.264 encoder that works on this machine.
+
+    ``ffmpeg -encoders`` only says what was compiled in (static builds list
+    NVENC without a GPU), so each listed candidate is tried on a short clip.
+    The result is cached for the life of the process.
+    """
+    try:
+        listed = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=30,
+        ).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+    for name, args in _ENCODER_ARGS.items():
+        if name == "libx264" or name not in listed:
+            continue
+        try:
+            probe = subprocess.run(
+                [
+                    "ffmpeg", "-hide_banner", "-loglevel", "error",
+                    "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.2",
+                    "-c:v", name, *args, "-pix_fmt", "yuv420p",
+                    "-f", "null", "-",
+                ],
+                capture_output=True, timeout=30,
+            )
+        except subprocess.TimeoutExpired:
+            continue
+        if probe.returncode == 0:
+            return name
+    return None
+
+
+@lru_cache(maxsize=None)
+def _vfr_args() -> list[str]:
+    """
+    ffmpeg arguments for variable-frame-rate output.
+
+    ``-fps_mode`` only exists from FFmpeg 5.1; older builds (4.x on current
+    LTS distros) reject it but accept ``-vsync``, which newer ones still
+    take with a deprecation warning. Cached for the life of the process.
+    """
+    try:
+        help_text = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-h", "long"],
+            capture_output=True, text=True, timeout=30,
+        ).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        help_text = ""
+    if "-fps_mode" in help_text:
+        return ["-fps_mode", "vfr"]
+    return ["-vsync", "vfr"]
+
+
+def _video_codec_args(encoder: str) -> list[str]:
+    """ffmpeg ``-c:v`` arguments for *encoder* ("auto" picks hardware if any)."""
+    if encoder == "auto":
+        encoder = _hardware_encoder() or "libx264"
+    return ["-c:v", encoder, *_ENCODER_ARGS.get(encoder, [])]
+
+
 # ---------------------------------------------------------------------------
 # Video assembly
 # ---------------------------------------------------------------------------
 
+# Rough cap on rendered frames held in this process while they wait for
+# ffmpeg, independent of the worker count
+FRAME_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Each render already uses every core (one worker per CPU plus ffmpeg), so
+# renders started concurrently (e.g. by the server's pipeline pool) take
+# turns instead of multiplying the process count.
+_RENDER_SLOT = threading.Semaphore(1)
+
+
+@contextmanager
+def _render_slot():
+    """Hold the process-wide render slot, waiting for it if another render has it."""
+    if not _RENDER_SLOT.acquire(blocking=False):
+        print("[render] Waiting for another render to finish...")
+        _RENDER_SLOT.acquire()
+    try:
+        yield
+    finally:
+        _RENDER_SLOT.release()
+
+
 def render_video(
     chunk_timings: list[list[dict]],
     audio_path: str,
@@ -248,6 +929,9 @@ def render_video(
     """
     Render the full karaoke video.
 
+    Only distinct frames are rendered, in parallel worker processes, and
+    streamed to ffmpeg in order with repeats filled in.
+
     Args:
         chunk_timings: List of chunks, each containing a list of word timing dicts.
         audio_path: Path to the audio file.
@@ -286,13 +970,6 @@ def render_video(
     print(f"[render] Audio duration: {audio_duration:.2f}s, total frames: {total_frames}")
     print(f"[render] Chunks: {len(chunk_timings)}")
 
-    # Load font
-    font = find_font(font_size)
-    print(f"[render] Font loaded: {font_size}px")
-
-    # Set up layout
-    layout = TextLayout(width, height, font, margin_x=margin_x, line_spacing=line_spacing)
-
     # Determine chunk time ranges
     chunk_ranges = []
     for chunk in chunk_timings:
@@ -303,159 +980,177 @@ def render_video(
         else:
             chunk_ranges.append((0, 0))
 
-    # Add padding between chunks for transitions
-    fade_duration = settings.fade_duration if settings is not None else 0.3
-
-    # Create temp directory for frames
-    temp_dir = tempfile.mkdtemp(prefix="book_karaoke_")
-    print(f"[render] Temp frames directory: {temp_dir}")
-
-    try:
-        # Render frames
-        print(f"[render] Rendering {total_frames} frames...")
-        last_percent = -1
-
-        for frame_idx in range(total_frames):
-            current_time = frame_idx / fps
-            progress = current_time / audio_duration if audio_duration > 0 else 0
-
-            # Find active chunk
-            active_chunk_idx = None
-            fade_alpha = 1.0
-
-            for ci, (cs, ce) in enumerate(chunk_ranges):
-                # Add some pre-roll so text appears slightly before the words start
-                pre_roll = settings.pre_roll if settings is not None else 0.3
-                # Add post-roll so text stays briefly after last word
-                base_post_roll = settings.post_roll if settings is not None else 0.3
-                post_roll = base_post_roll if ci < len(chunk_ranges) - 1 else 1.0
-
-                if current_time >= cs - pre_roll and current_time <= ce + post_roll:
-                    active_chunk_idx = ci
-
-                    # Fade in
-                    if current_time < cs:
-                        fade_alpha = max(0.0, 1.0 - (cs - current_time) / pre_roll)
-                    # Fade out
-                    elif current_time > ce:
-                        fade_alpha = max(0.0, 1.0 - (current_time - ce) / post_roll)
-                    else:
-                        fade_alpha = 1.0
+    # Word positions are constant per chunk: lay each chunk out once here
+    # instead of on every frame in the workers.
+    layout = _get_layout(font_size, width, height, margin_x, line_spacing)
+
+    ctx = _RenderContext(
+        chunks=[_ChunkData.build(layout, chunk) for chunk in chunk_timings],
+        chunk_ranges=chunk_ranges,
+        audio_duration=audio_duration,
+        width=width,
+        height=height,
+        fps=fps,
+        font_size=font_size,
+        style=_Style.from_settings(settings),
+        settings=settings,
+        # Frames are converted to the encoder's 4:2:0 layout once per
+        # unique frame in the workers, halving the pipe traffic and sparing
+        # ffmpeg a colorspace pass on every repeat. 4:2:0 needs even
+        # dimensions; odd sizes keep piping RGB.
+        pix_fmt="yuv420p" if width % 2 == 0 and height % 2 == 0 else "rgb24",
+    )
+    ctx.index_frames(total_frames)
+    workers = os.cpu_count() or 1
+    print(f"[render] Font size: {font_size}px, workers: {workers}")
+
+    # Most consecutive frames are identical (nothing changes until a word
+    # boundary or the next progress bar pixel), so only the first frame of
+    # each run is rendered and then repeated on the pipe.
+    runs = _frame_runs(ctx, total_frames)
+
+    # Bound rendered-but-unwritten frames by memory rather than by batch
+    # count: when ffmpeg is the bottleneck every in-flight result sits in
+    # this process. workers + 1 batches keep every worker busy while one is
+    # being written; the batch size is whatever fits the budget across them.
+    frame_bytes = width * height * (3 if ctx.pix_fmt == "rgb24" else 3 / 2)
+    inflight_batches = workers + 1
+    max_inflight_frames = max(inflight_batches, int(FRAME_MEMORY_BUDGET // frame_bytes))
+    batch_size = max(1, min(fps, max_inflight_frames // inflight_batches))
+    batches = [runs[i:i + batch_size] for i in range(0, len(runs), batch_size)]
+    print(f"[render] Unique frames: {len(runs)} of {total_frames}")
+
+    codec_args = _video_codec_args(settings.video_encoder if settings is not None else "auto")
+    print(f"[render] Video encoder: {codec_args[1]}")
+
+    # Ensure output directory exists
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    # Frames are piped to ffmpeg raw, so nothing touches the disk between
+    # the renderer and the encoder.
+    ffmpeg_cmd = [
+        "ffmpeg", "-y",
+        "-f", "rawvideo",
+        "-pix_fmt", ctx.pix_fmt,
+        "-s", f"{width}x{height}",
+        "-framerate", str(fps),
+        "-i", "-",
+        "-i", audio_path,
+        # Drop exact repeats (hi=lo=frac=0) before the encoder and keep the
+        # stream variable-frame-rate, so x264 only sees frames that change.
+        # No -shortest: trailing repeats are dropped too, and the player
+        # simply holds the last frame until the audio ends.
+        "-vf", "mpdecimate=hi=0:lo=0:frac=0",
+        *_vfr_args(),
+        *codec_args,
+        "-pix_fmt", "yuv420p",
+        "-c:a", "aac",
+        "-b:a", "192k",
+        output_path,
+    ]
+
+    # Workers are spawned rather than forked: by now this process may be
+    # running other threads (the web server's, the pipeline pool, the pipe
+    # writer below), and a forked child can inherit a lock one of them held.
+    # _init_worker rebuilds everything a worker needs from ctx anyway.
+    # ffmpeg's stderr goes to a temp file rather than a pipe: a full pipe
+    # would block ffmpeg while we are blocked writing frames to it.
+    with (
+        _render_slot(),
+        ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(ctx,),
+        ) as pool,
+        tempfile.TemporaryFile() as ffmpeg_log,
+    ):
+        proc = subprocess.Popen(
+            ffmpeg_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=ffmpeg_log,
+        )
+        writer = _PipeWriter(proc.stdin)
+        try:
+            # Render frames
+            print(f"[render] Rendering {total_frames} frames...")
+            last_percent = -1
+
+            # Keep a bounded window of batches in flight (see batch_size) so
+            # finished frames never pile up faster than ffmpeg consumes them.
+            # The next batch is submitted only once the oldest has been
+            # handed to the writer, so the batch being written counts too.
+            def submit(batch):
+                return batch, pool.submit(_render_frames, [idx for idx, _ in batch])
+
+            batch_iter = iter(batches)
+            pending = deque(submit(batch) for batch in islice(batch_iter, inflight_batches))
+
+            frames_done = 0
+            while pending:
+                batch, future = pending.popleft()
+                frames = future.result()
+
+                if writer.broken:
+                    # ffmpeg exited early; its error is reported below
+                    pool.shutdown(cancel_futures=True)
                     break
 
-            # Resolve colors for frame creation
-            _bg = settings.bg_rgb if settings is not None else COLOR_BG
-
-            # Create frame
-            img = Image.new("RGB", (width, height), _bg)
-            draw = ImageDraw.Draw(img)
-
-            if active_chunk_idx is not None:
-                chunk = chunk_timings[active_chunk_idx]
-                chunk_words = [w["word"] for w in chunk]
-                render_frame(
-                    draw=draw,
-                    layout=layout,
-                    chunk_words=chunk_words,
-                    chunk_timings=chunk,
-                    current_time=current_time,
-                    progress=progress,
-                    width=width,
-                    height=height,
-                    fade_alpha=fade_alpha,
-                    settings=settings,
-                )
-            else:
-                # Empty frame (between chunks or before/after audio)
-                if settings is not None:
-                    _progress_bg = settings.progress_bg_rgb
-                    _progress_fg = settings.progress_fg_rgb
-                    _bar_height = settings.progress_bar_height
-                    _bar_bottom = settings.progress_bar_bottom_offset
-                    _bar_margin = settings.progress_bar_margin
-                else:
-                    _progress_bg = COLOR_PROGRESS_BG
-                    _progress_fg = COLOR_PROGRESS_FG
-                    _bar_height = 4
-                    _bar_bottom = 60
-                    _bar_margin = 80
-
-                draw.rectangle([0, 0, width, height], fill=_bg)
-                # Still draw progress bar
-                bar_y = height - _bar_bottom
-                bar_width_px = width - 2 * _bar_margin
-                draw.rectangle(
-                    [_bar_margin, bar_y, _bar_margin + bar_width_px, bar_y + _bar_height],
-                    fill=_progress_bg,
-                )
-                fill_width = int(bar_width_px * progress)
-                if fill_width > 0:
-                    draw.rectangle(
-                        [_bar_margin, bar_y, _bar_margin + fill_width, bar_y + _bar_height],
-                        fill=_progress_fg,
+                # Send frames to the encoder, each repeated for its run
+                for (_, count), data in zip(batch, frames):
+                    writer.put(data, count)
+                frames_done += sum(count for _, count in batch)
+                del frames
+
+                next_batch = next(batch_iter, None)
+                if next_batch is not None:
+                    pending.append(submit(next_batch))
+
+                # Progress reporting
+                percent = int(frames_done / total_frames * 100)
+                if percent != last_percent and percent // 5 != last_percent // 5:
+                    print(f"[render] {percent}% ({frames_done}/{total_frames} frames)")
+                    last_percent = percent
+
+                # Progress callback (once per rendered batch)
+                if progress_callback:
+                    progress_callback(
+                        "rendering",
+                        frames_done / total_frames,
+                        f"Rendering frame {frames_done}/{total_frames}",
                     )
 
-            # Save frame
-            frame_path = os.path.join(temp_dir, f"frame_{frame_idx:06d}.png")
-            img.save(frame_path)
-
-            # Progress reporting
-            percent = int((frame_idx + 1) / total_frames * 100)
-            if percent != last_percent and percent % 5 == 0:
-                print(f"[render] {percent}% ({frame_idx + 1}/{total_frames} frames)")
-                last_percent = percent
-
-            # Progress callback (every 30 frames to avoid excessive calls)
-            if progress_callback and frame_idx % 30 == 0:
-                progress_callback(
-                    "rendering",
-                    frame_idx / total_frames,
-                    f"Rendering frame {frame_idx}/{total_frames}",
-                )
-
-        print(f"[render] All frames rendered. Assembling video with ffmpeg...")
-
-        if progress_callback:
-            progress_callback("rendering", 0.95, "Assembling video with ffmpeg...")
-
-        # Ensure output directory exists
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-        # Assemble video with ffmpeg
-        ffmpeg_cmd = [
-            "ffmpeg", "-y",
-            "-framerate", str(fps),
-            "-i", os.path.join(temp_dir, "frame_%06d.png"),
-            "-i", audio_path,
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "23",
-            "-pix_fmt", "yuv420p",
-            "-c:a", "aac",
-            "-b:a", "192k",
-            "-shortest",
-            output_path,
-        ]
-
-        result = subprocess.run(
-            ffmpeg_cmd,
-            capture_output=True,
-            text=True,
-        )
+            # Release the workers while ffmpeg finishes encoding
+            pool.shutdown()
 
-        if result.returncode != 0:
-            print(f"[render] ffmpeg stderr:\n{result.stderr}")
-            raise RuntimeError(f"ffmpeg failed with return code {result.returncode}")
+            print(f"[render] All frames rendered. Finishing encode with ffmpeg...")
 
-        file_size = os.path.getsize(output_path)
-        print(f"[render] Video saved to {output_path} ({file_size / (1024 * 1024):.1f} MB)")
+            if progress_callback:
+                progress_callback("rendering", 0.95, "Finishing encode with ffmpeg...")
 
-        if progress_callback:
-            progress_callback("rendering", 1.0, "Video rendering complete")
+            writer.close()
+            returncode = proc.wait()
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            proc.kill()
+            writer.close()
+            proc.wait()
+            # Don't leave a truncated video where a finished one is expected
+            Path(output_path).unlink(missing_ok=True)
+            raise
 
-        return output_path
+        if returncode != 0:
+            Path(output_path).unlink(missing_ok=True)
+            ffmpeg_log.seek(0)
+            stderr = ffmpeg_log.read().decode("utf-8", errors="replace")
+            print(f"[render] ffmpeg stderr:\n{stderr}")
+            raise RuntimeError(f"ffmpeg failed with return code {returncode}")
 
-    finally:
-        # Clean up temp frames
-        print(f"[render] Cleaning up temp frames...")
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    file_size = os.path.getsize(output_path)
+    print(f"[render] Video saved to {output_path} ({file_size / (1024 * 1024):.1f} MB)")
+
+    if progress_callback:
+        progress_callback("rendering", 1.0, "Video rendering complete")
+
+    return output_path
@@ -9,11 +9,18 @@ Projects are persisted to the projects/ directory on disk.
 from __future__ import annotations
 
 import asyncio
+import atexit
+import hashlib
 import json
+import os
 import re
 import shutil
 import tempfile
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -27,6 +34,18 @@ from .export import export_srt, export_vtt
 from .export_html import generate_standalone_html
 from .pipeline import Pipeline
 
+# orjson is an optional speedup for metadata and SSE payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack, if installed, adds a binary copy of project.json that loads faster
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # ---------------------------------------------------------------------------
 # App setup
 # ---------------------------------------------------------------------------
@@ -40,44 +59,165 @@ STATIC_DIR = Path(__file__).parent.parent / "static"
 PROJECTS_DIR = Path(__file__).parent.parent / "projects"
 PROJECTS_DIR.mkdir(exist_ok=True)
 
+# Pipeline and export runs share one bounded pool: each run is CPU-heavy
+# (TTS, Whisper, rendering), so concurrent requests queue up instead of
+# oversubscribing the machine like the loop's default executor would.
+# Rendering, which uses every core by itself, is further limited to one
+# run at a time inside render_video.
+PIPELINE_POOL = ThreadPoolExecutor(
+    max_workers=max(1, (os.cpu_count() or 2) // 2),
+    thread_name_prefix="pipeline",
+)
+atexit.register(PIPELINE_POOL.shutdown, wait=False)
+
 # ---------------------------------------------------------------------------
-# In-memory session store
+# JSON encoding
 # ---------------------------------------------------------------------------
 
-sessions: dict[str, dict[str, Any]] = {}
+def _json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _sse(event: str, data: Any) -> bytes:
+    """Frame one server-sent event with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + _json_bytes(data) + b"\n\n"
 
 
-def _get_session(session_id: str) -> dict:
+# ---------------------------------------------------------------------------
+# In-memory session store
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class Session:
+    """One uploaded input and everything the pipeline derived from it."""
+
+    id: str
+    work_dir: str
+    text_path: str | None = None
+    audio_path: str | None = None
+    text: str | None = None
+    # Library summary of the text, computed once when the text is known
+    title: str | None = None
+    preview: str | None = None
+    word_count: int | None = None
+    chunks: list | None = None
+    chunks_with_timings: list | None = None
+    settings: dict[str, Any] = field(default_factory=dict)
+    formatting: dict[str, Any] = field(default_factory=dict)
+    chapters: list | None = None
+    audio_generated_path: str | None = None
+    video_path: str | None = None
+    duration: float | None = None
+    status: str = "uploaded"
+    error: str | None = None
+    created_at: str | None = None
+    original_filename: str | None = None
+
+
+# Least recently used first. Saved projects past MAX_SESSIONS are dropped
+# from memory and reloaded from disk on their next request.
+sessions: OrderedDict[str, Session] = OrderedDict()
+MAX_SESSIONS = 500
+
+
+def _get_session(session_id: str) -> Session:
     """Retrieve a session or raise 404."""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
-    return sessions[session_id]
+    session = sessions.get(session_id)
+    if session is None:
+        session = _load_project(session_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+        _remember(session)
+    else:
+        sessions.move_to_end(session_id)
+    return session
+
+
+def _remember(session: Session) -> None:
+    """Add *session* as the most recently used, evicting old saved ones."""
+    sessions[session.id] = session
+    sessions.move_to_end(session.id)
+    if len(sessions) <= MAX_SESSIONS:
+        return
+    for sid in list(sessions)[:-1]:
+        if len(sessions) <= MAX_SESSIONS:
+            break
+        old = sessions[sid]
+        # Only sessions that _load_project can fully restore
+        if (
+            old.status == "ready"
+            and old.video_path is None
+            and os.path.exists(os.path.join(PROJECTS_DIR, sid, "project.json"))
+        ):
+            del sessions[sid]
 
 
 def _new_session_id() -> str:
     return uuid.uuid4().hex[:12]
 
 
+# (unix second, its local ISO timestamp) last produced by _iso_now
+_iso_now_cache: tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """
+    Current local time as an ISO 8601 string, to whole seconds.
+
+    Timestamps only order projects, so one formatted string is reused for
+    every call within the same second.
+    """
+    global _iso_now_cache
+    now = int(time.time())
+    if _iso_now_cache[0] != now:
+        _iso_now_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _iso_now_cache[1]
+
+
+# Shape of _new_session_id() values, i.e. sessions not yet given a slug
+_TEMP_ID_RE = re.compile(r"[0-9a-f]{12}")
+
+
+def _is_temp_id(session_id: str) -> bool:
+    return _TEMP_ID_RE.fullmatch(session_id) is not None
+
+
 # ---------------------------------------------------------------------------
 # Slug generation
 # ---------------------------------------------------------------------------
 
+# Upload names that say nothing about the content
+_GENERIC_STEMS = frozenset({"input", "file", "upload", "text", "document", "untitled"})
+_SLUG_FILENAME_RE = re.compile(r"[^a-z0-9]+")
+_SLUG_TEXT_RE = re.compile(r"[^a-zA-Z0-9\s]")
+
+
 def _slugify_filename(filename: str) -> str | None:
     """Generate a slug from a filename. Returns None if generic/unusable."""
     if not filename:
         return None
     stem = Path(filename).stem.lower()
     # Skip generic names
-    if stem in ("input", "file", "upload", "text", "document", "untitled"):
+    if stem in _GENERIC_STEMS:
         return None
     # Replace non-alphanumeric with hyphens, collapse multiples
-    slug = re.sub(r"[^a-z0-9]+", "-", stem).strip("-")
+    slug = _SLUG_FILENAME_RE.sub("-", stem).strip("-")
     return slug if slug else None
 
 
 def _slugify_text(text: str, max_words: int = 6) -> str:
     """Generate a slug from the first few words of text."""
-    clean = re.sub(r"[^a-zA-Z0-9\s]", "", text.lower())
+    clean = _SLUG_TEXT_RE.sub("", text.lower())
     words = clean.split()[:max_words]
     slug = "-".join(words)
     if not slug:
@@ -99,54 +239,89 @@ def _unique_slug(base_slug: str) -> str:
 # Project persistence
 # ---------------------------------------------------------------------------
 
-def _save_project(session: dict) -> None:
+def _save_project(session: Session) -> None:
     """Save a completed project to disk."""
-    slug = session["id"]
+    slug = session.id
     project_dir = PROJECTS_DIR / slug
     project_dir.mkdir(parents=True, exist_ok=True)
 
     # Copy audio file to project dir
-    audio_src = session.get("audio_generated_path") or session.get("audio_path")
+    audio_src = session.audio_generated_path or session.audio_path
     audio_dest = None
-    if audio_src and Path(audio_src).exists():
-        ext = Path(audio_src).suffix
+    if audio_src and os.path.exists(audio_src):
+        ext = os.path.splitext(audio_src)[1]
         audio_dest = str(project_dir / f"audio{ext}")
-        if str(Path(audio_src).resolve()) != str(Path(audio_dest).resolve()):
-            shutil.copy2(audio_src, audio_dest)
+        _copy_unless_same(audio_src, audio_dest)
 
     # Copy input file to project dir
-    text_src = session.get("text_path")
+    text_src = session.text_path
     text_dest = None
-    if text_src and Path(text_src).exists():
-        ext = Path(text_src).suffix
+    if text_src and os.path.exists(text_src):
+        ext = os.path.splitext(text_src)[1]
         text_dest = str(project_dir / f"input{ext}")
-        if str(Path(text_src).resolve()) != str(Path(text_dest).resolve()):
-            shutil.copy2(text_src, text_dest)
-
-    # Build preview (first ~100 chars of text)
-    text = session.get("text") or ""
-    preview = text[:120].replace("\n", " ").strip()
-    if len(text) > 120:
-        preview += "..."
+        _copy_unless_same(text_src, text_dest)
 
     # Save metadata
     meta = {
         "id": slug,
-        "title": _title_from_text(text),
-        "preview": preview,
-        "created_at": session.get("created_at", datetime.now().isoformat()),
-        "duration": session.get("duration"),
-        "word_count": len(text.split()) if text else 0,
-        "settings": session.get("settings", {}),
-        "chunks": session.get("chunks"),
-        "chunks_with_timings": session.get("chunks_with_timings"),
-        "formatting": session.get("formatting", {}),
-        "chapters": session.get("chapters"),
-        "audio_file": Path(audio_dest).name if audio_dest else None,
-        "input_file": Path(text_dest).name if text_dest else None,
+        "title": session.title or "",
+        "preview": session.preview or "",
+        "created_at": session.created_at or _iso_now(),
+        "duration": session.duration,
+        "word_count": session.word_count or 0,
+        "settings": session.settings,
+        "chunks": session.chunks,
+        "chunks_with_timings": session.chunks_with_timings,
+        "formatting": session.formatting,
+        "chapters": session.chapters,
+        "audio_file": os.path.basename(audio_dest) if audio_dest else None,
+        "input_file": os.path.basename(text_dest) if text_dest else None,
     }
 
-    (project_dir / "project.json").write_text(json.dumps(meta, indent=2))
+    meta_path = project_dir / "project.json"
+    changed = _write_if_changed(meta_path, _json_bytes(meta, indent=True))
+    if changed:
+        _project_meta_cache.pop(str(meta_path), None)
+    # Written after project.json, so its mtime marks it as up to date
+    mp_path = project_dir / "project.mp"
+    if msgpack is not None and (changed or not mp_path.exists()):
+        _atomic_write(mp_path, msgpack.packb(meta, use_bin_type=True))
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a temp file, so readers never see it half-written."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Atomically write *data* to *path* unless it already holds exactly that."""
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    _atomic_write(path, data)
+    return True
+
+
+def _copy_unless_same(src: str, dest: str) -> None:
+    """Copy *src* to *dest*, unless they are already the same file."""
+    try:
+        same = os.path.samefile(src, dest)
+    except FileNotFoundError:
+        same = False
+    if not same:
+        shutil.copy2(src, dest)
+
+
+def _preview_from_text(text: str) -> str:
+    """First ~120 characters of text on one line, for the library view."""
+    preview = text[:120].replace("\n", " ").strip()
+    if len(text) > 120:
+        preview += "..."
+    return preview
 
 
 def _title_from_text(text: str) -> str:
@@ -159,55 +334,112 @@ def _title_from_text(text: str) -> str:
     return " ".join(words) + "..."
 
 
+# Parsed project.json files by path, with the mtime they were read at
+_project_meta_cache: dict[str, tuple[int, dict]] = {}
+
+
+def _read_project_meta(project_dir: str) -> dict | None:
+    """
+    Return the parsed project.json in *project_dir*, or None if it is missing.
+
+    The file is only re-read and re-parsed when its mtime has changed since
+    the last call. When msgpack is installed, the project.mp sidecar is
+    decoded instead, unless project.json has been modified after it (e.g.
+    edited by hand).
+    """
+    meta_path = os.path.join(project_dir, "project.json")
+    try:
+        mtime = os.stat(meta_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _project_meta_cache.get(meta_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    meta = None
+    if msgpack is not None:
+        mp_path = os.path.join(project_dir, "project.mp")
+        try:
+            if os.stat(mp_path).st_mtime_ns >= mtime:
+                with open(mp_path, "rb") as f:
+                    meta = msgpack.unpackb(f.read(), raw=False)
+        except FileNotFoundError:
+            pass
+    if meta is None:
+        with open(meta_path, "rb") as f:
+            meta = _json_loads(f.read())
+    _project_meta_cache[meta_path] = (mtime, meta)
+    return meta
+
+
+def _project_dirs() -> list[os.DirEntry]:
+    """Project directories under PROJECTS_DIR, sorted by name."""
+    # DirEntry.is_dir() uses the type scandir already read, so no extra stat
+    with os.scandir(PROJECTS_DIR) as it:
+        return sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+
+def _session_from_meta(project_dir: Path, meta: dict) -> Session:
+    """Rebuild a ready session from a saved project's metadata."""
+    # Find audio file
+    audio_path = None
+    if meta.get("audio_file"):
+        audio_path = str(project_dir / meta["audio_file"])
+
+    # Find input file
+    text_path = None
+    if meta.get("input_file"):
+        text_path = str(project_dir / meta["input_file"])
+
+    return Session(
+        id=meta["id"],
+        work_dir=str(project_dir),
+        text_path=text_path,
+        audio_path=audio_path,
+        text=None,  # not loaded into memory
+        title=meta.get("title"),
+        preview=meta.get("preview"),
+        word_count=meta.get("word_count"),
+        chunks=meta.get("chunks"),
+        chunks_with_timings=meta.get("chunks_with_timings"),
+        settings=meta.get("settings", {}),
+        formatting=meta.get("formatting", {}),
+        chapters=meta.get("chapters"),
+        audio_generated_path=audio_path,
+        duration=meta.get("duration"),
+        status="ready",
+        created_at=meta.get("created_at"),
+    )
+
+
+def _load_project(slug: str) -> Session | None:
+    """Load one saved project by slug, or None if there is no such project."""
+    if not slug or slug.startswith(".") or os.sep in slug:
+        return None
+    project_dir = PROJECTS_DIR / slug
+    try:
+        meta = _read_project_meta(str(project_dir))
+        if meta is None or meta.get("id") != slug:
+            return None
+        return _session_from_meta(project_dir, meta)
+    except Exception as exc:
+        print(f"[warn] Failed to load project {slug}: {exc}")
+        return None
+
+
 def _load_projects() -> None:
     """Scan the projects/ directory and load saved projects into sessions."""
     if not PROJECTS_DIR.exists():
         return
 
-    for project_dir in sorted(PROJECTS_DIR.iterdir()):
-        if not project_dir.is_dir():
-            continue
-        meta_path = project_dir / "project.json"
-        if not meta_path.exists():
-            continue
-
+    for entry in _project_dirs():
         try:
-            meta = json.loads(meta_path.read_text())
-            slug = meta["id"]
-
-            # Find audio file
-            audio_path = None
-            if meta.get("audio_file"):
-                audio_path = str(project_dir / meta["audio_file"])
-
-            # Find input file
-            text_path = None
-            if meta.get("input_file"):
-                text_path = str(project_dir / meta["input_file"])
-
-            session = {
-                "id": slug,
-                "work_dir": str(project_dir),
-                "text_path": text_path,
-                "audio_path": audio_path,
-                "text": None,  # not loaded into memory
-                "chunks": meta.get("chunks"),
-                "chunks_with_timings": meta.get("chunks_with_timings"),
-                "settings": meta.get("settings", {}),
-                "formatting": meta.get("formatting", {}),
-                "chapters": meta.get("chapters"),
-                "audio_generated_path": audio_path,
-                "video_path": None,
-                "duration": meta.get("duration"),
-                "status": "ready",
-                "error": None,
-                "progress_events": [],
-                "processing_done": None,
-                "created_at": meta.get("created_at"),
-            }
-            sessions[slug] = session
+            meta = _read_project_meta(entry.path)
+            if meta is None:
+                continue
+            _remember(_session_from_meta(Path(entry.path), meta))
         except Exception as exc:
-            print(f"[warn] Failed to load project {project_dir.name}: {exc}")
+            print(f"[warn] Failed to load project {entry.name}: {exc}")
 
 
 # Load existing projects on import
@@ -240,8 +472,10 @@ async def upload_file(
     saved_name = f"input{ext}"
     saved_path = Path(work_dir) / saved_name
 
-    content = await file.read()
-    saved_path.write_bytes(content)
+    # Copy in 1 MB pieces rather than holding the whole upload in memory
+    with open(saved_path, "wb") as out:
+        while chunk := await file.read(1 << 20):
+            out.write(chunk)
 
     # Determine what we got
     text_path = None
@@ -265,27 +499,17 @@ async def upload_file(
     if words_per_chunk is not None:
         settings["max_words_per_chunk"] = words_per_chunk
 
-    session = {
-        "id": temp_id,
-        "work_dir": work_dir,
-        "text_path": text_path,
-        "audio_path": audio_path,
-        "text": None,
-        "chunks": None,
-        "chunks_with_timings": None,
-        "settings": settings,
-        "chapters": None,
-        "audio_generated_path": None,
-        "video_path": None,
-        "duration": None,
-        "status": "uploaded",
-        "error": None,
-        "progress_events": [],
-        "processing_done": None,
-        "created_at": datetime.now().isoformat(),
-        "original_filename": file.filename,
-    }
-    sessions[temp_id] = session
+    session = Session(
+        id=temp_id,
+        work_dir=work_dir,
+        text_path=text_path,
+        audio_path=audio_path,
+        settings=settings,
+        status="uploaded",
+        created_at=_iso_now(),
+        original_filename=file.filename,
+    )
+    _remember(session)
 
     return {"id": temp_id, "status": "uploaded", "input_mode": input_mode}
 
@@ -308,21 +532,20 @@ async def reprocess_session(
 
     # Update settings
     if voice:
-        session["settings"]["voice"] = voice
+        session.settings["voice"] = voice
     if words_per_chunk is not None:
-        session["settings"]["max_words_per_chunk"] = words_per_chunk
+        session.settings["max_words_per_chunk"] = words_per_chunk
 
     # Reset session state so /api/process will re-run the pipeline
-    session["status"] = "uploaded"
-    session["chunks"] = None
-    session["chunks_with_timings"] = None
-    session["chapters"] = None
-    session["audio_generated_path"] = None
-    session["video_path"] = None
-    session["duration"] = None
-    session["error"] = None
-    session["progress_events"] = []
-    session["processing_done"] = None
+    session.status = "uploaded"
+    session.chunks = None
+    session.chunks_with_timings = None
+    session.chapters = None
+    session.audio_generated_path = None
+    session.video_path = None
+    session.duration = None
+    session.error = None
+    _clear_html_exports(session.work_dir)
 
     return {"id": session_id, "status": "uploaded"}
 
@@ -340,47 +563,33 @@ async def process_session(session_id: str):
     """
     session = _get_session(session_id)
 
-    if session["status"] == "ready":
+    if session.status == "ready":
         # Already processed -- send a single complete event
         async def already_done():
             data = {
                 "id": session_id,
                 "audio_url": f"/api/audio/{session_id}",
-                "timestamps": session["chunks_with_timings"],
-                "duration": session["duration"],
-                "formatting": session.get("formatting", {}),
-                "chapters": session.get("chapters"),
+                "timestamps": session.chunks_with_timings,
+                "duration": session.duration,
+                "formatting": session.formatting,
+                "chapters": session.chapters,
             }
-            yield f"event: complete\ndata: {json.dumps(data)}\n\n"
+            yield _sse("complete", data)
 
         return StreamingResponse(already_done(), media_type="text/event-stream")
 
-    session["status"] = "processing"
-    done_event = asyncio.Event()
-    session["processing_done"] = done_event
-    session["progress_events"] = []
+    session.status = "processing"
+    # The progress queue lives only as long as this stream, not on the session
+    loop = asyncio.get_running_loop()
+    progress = {"loop": loop, "progress_queue": asyncio.Queue()}
 
     async def event_generator():
         # Start the pipeline in a background thread
-        loop = asyncio.get_event_loop()
-        task = loop.run_in_executor(None, _run_pipeline, session_id)
-
-        # Poll for progress events while the pipeline runs
-        idx = 0
-        while not done_event.is_set():
-            await asyncio.sleep(0.15)
-            events = session["progress_events"]
-            while idx < len(events):
-                evt = events[idx]
-                idx += 1
-                yield f"event: progress\ndata: {json.dumps(evt)}\n\n"
-
-        # Drain any remaining progress events
-        events = session["progress_events"]
-        while idx < len(events):
-            evt = events[idx]
-            idx += 1
-            yield f"event: progress\ndata: {json.dumps(evt)}\n\n"
+        task = loop.run_in_executor(PIPELINE_POOL, _run_pipeline, session_id, progress)
+
+        # Relay progress events as the pipeline reports them
+        async for chunk in _progress_stream(progress["progress_queue"]):
+            yield chunk
 
         # Wait for the background task to finish and check for errors
         try:
@@ -389,78 +598,112 @@ async def process_session(session_id: str):
             pass
 
         # Send final event — use the (possibly updated) slug as ID
-        final_id = session["id"]
-        if session["status"] == "error":
-            yield f"event: error\ndata: {json.dumps({'error': session['error']})}\n\n"
+        final_id = session.id
+        if session.status == "error":
+            yield _sse("error", {"error": session.error})
         else:
             data = {
                 "id": final_id,
                 "audio_url": f"/api/audio/{final_id}",
-                "timestamps": session["chunks_with_timings"],
-                "duration": session["duration"],
-                "formatting": session.get("formatting", {}),
-                "chapters": session.get("chapters"),
+                "timestamps": session.chunks_with_timings,
+                "duration": session.duration,
+                "formatting": session.formatting,
+                "chapters": session.chapters,
             }
-            yield f"event: complete\ndata: {json.dumps(data)}\n\n"
+            yield _sse("complete", data)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 
-def _run_pipeline(session_id: str) -> None:
+def _push_progress(owner: dict, event: dict | None) -> None:
+    """
+    Queue a progress event for *owner* (a pipeline run's progress channel or
+    an export job) from a worker thread. None marks the end of the stream.
+    """
+    owner["loop"].call_soon_threadsafe(owner["progress_queue"].put_nowait, event)
+
+
+async def _progress_stream(queue: asyncio.Queue):
+    """
+    Yield SSE progress events from *queue* until the end-of-stream marker.
+
+    Events that pile up while the client is slow are coalesced: an update
+    followed by another for the same step is skipped, so a backlog costs
+    one message per step rather than one per update.
+    """
+    done = False
+    while not done:
+        batch = [await queue.get()]
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        if batch[-1] is None:
+            done = True
+            batch.pop()
+        for i, evt in enumerate(batch):
+            if i + 1 < len(batch) and batch[i + 1]["step"] == evt["step"]:
+                continue
+            yield _sse("progress", evt)
+    # Leave the marker in place so any other listener stops too
+    queue.put_nowait(None)
+
+
+def _run_pipeline(session_id: str, channel: dict) -> None:
     """Run the pipeline synchronously (called in a thread)."""
     session = sessions[session_id]
-    done_event = session["processing_done"]
 
     def progress_callback(step: str, progress: float, message: str):
-        session["progress_events"].append({
+        _push_progress(channel, {
             "step": step,
             "progress": progress,
             "message": message,
         })
 
     try:
-        settings_data = dict(session["settings"])
+        settings_data = dict(session.settings)
         settings = KaraokeSettings.from_dict(settings_data)
 
         pipeline = Pipeline(
             settings=settings,
-            text_path=session["text_path"],
-            audio_path=session["audio_path"],
+            text_path=session.text_path,
+            audio_path=session.audio_path,
             output_path=None,  # no video render during process
             progress_callback=progress_callback,
         )
 
         result = pipeline.run()
 
-        session["text"] = result.text
-        session["chunks"] = result.chunks
-        session["chunks_with_timings"] = result.chunks_with_timings
-        session["formatting"] = result.formatting or {}
-        session["chapters"] = result.chapters
-        session["audio_generated_path"] = result.audio_path
-        session["duration"] = result.duration
-        session["status"] = "ready"
+        session.text = result.text
+        session.title = _title_from_text(result.text)
+        session.preview = _preview_from_text(result.text)
+        session.word_count = result.word_count
+        session.chunks = result.chunks
+        session.chunks_with_timings = result.chunks_with_timings
+        session.formatting = result.formatting or {}
+        session.chapters = result.chapters
+        session.audio_generated_path = result.audio_path
+        session.duration = result.duration
+        session.status = "ready"
 
         # Assign a readable slug (if still using temp hex ID)
-        old_id = session["id"]
-        if len(old_id) == 12 and all(c in "0123456789abcdef" for c in old_id):
+        old_id = session.id
+        if _is_temp_id(old_id):
             # Prefer filename, fall back to first words of text
-            base_slug = _slugify_filename(session.get("original_filename")) \
+            base_slug = _slugify_filename(session.original_filename) \
                         or _slugify_text(result.text)
             slug = _unique_slug(base_slug)
-            session["id"] = slug
-            sessions[slug] = session
+            session.id = slug
             del sessions[old_id]
+            _remember(session)
 
         # Persist to disk
         _save_project(session)
 
     except Exception as exc:
-        session["status"] = "error"
-        session["error"] = str(exc)
+        session.status = "error"
+        session.error = str(exc)
 
     finally:
-        done_event.set()
+        _push_progress(channel, None)
 
 
 # ---------------------------------------------------------------------------
@@ -468,7 +711,22 @@ def _run_pipeline(session_id: str) -> None:
 # ---------------------------------------------------------------------------
 
 # Export jobs (for MP4 rendering with separate progress tracking)
-export_jobs: dict[str, dict[str, Any]] = {}
+# Oldest first. Finished jobs are dropped after EXPORT_JOB_TTL seconds, or
+# sooner once there are more than MAX_EXPORT_JOBS.
+export_jobs: OrderedDict[str, dict[str, Any]] = OrderedDict()
+MAX_EXPORT_JOBS = 50
+EXPORT_JOB_TTL = 3600
+
+
+def _prune_export_jobs() -> None:
+    """Forget finished export jobs that are expired or over the cap."""
+    now = time.monotonic()
+    finished = [jid for jid, job in export_jobs.items() if job["finished_at"] is not None]
+    excess = len(export_jobs) - MAX_EXPORT_JOBS
+    for jid in finished:
+        if excess > 0 or now - export_jobs[jid]["finished_at"] > EXPORT_JOB_TTL:
+            del export_jobs[jid]
+            excess -= 1
 
 
 @app.post("/api/export/mp4/{session_id}")
@@ -476,25 +734,29 @@ async def export_mp4(session_id: str):
     """Start an MP4 export job. Returns a job_id for progress tracking."""
     session = _get_session(session_id)
 
-    if session["status"] != "ready":
+    if session.status != "ready":
         raise HTTPException(status_code=400, detail="Session not ready; run /api/process first")
 
-    if not session["chunks_with_timings"]:
+    if not session.chunks_with_timings:
         raise HTTPException(status_code=400, detail="No timestamp data available")
 
+    _prune_export_jobs()
     job_id = _new_session_id()
+    loop = asyncio.get_running_loop()
     export_jobs[job_id] = {
         "session_id": session_id,
+        # Held directly: the session may be evicted from `sessions` meanwhile
+        "session": session,
         "status": "rendering",
-        "progress_events": [],
-        "done_event": asyncio.Event(),
+        "finished_at": None,
+        "progress_queue": asyncio.Queue(),
+        "loop": loop,
         "video_path": None,
         "error": None,
     }
 
     # Start render in background
-    loop = asyncio.get_event_loop()
-    loop.run_in_executor(None, _run_export, job_id)
+    loop.run_in_executor(PIPELINE_POOL, _run_export, job_id)
 
     return {"job_id": job_id, "status": "rendering"}
 
@@ -502,37 +764,36 @@ async def export_mp4(session_id: str):
 def _run_export(job_id: str) -> None:
     """Run video rendering synchronously (called in a thread)."""
     job = export_jobs[job_id]
-    session = sessions[job["session_id"]]
-    done_event = job["done_event"]
+    session = job["session"]
 
     def progress_callback(step: str, progress: float, message: str):
-        job["progress_events"].append({
+        _push_progress(job, {
             "step": step,
             "progress": progress,
             "message": message,
         })
 
     try:
-        settings = KaraokeSettings.from_dict(session["settings"])
-        output_path = str(Path(session["work_dir"]) / "karaoke.mp4")
+        settings = KaraokeSettings.from_dict(session.settings)
+        output_path = str(Path(session.work_dir) / "karaoke.mp4")
 
-        audio_path = session.get("audio_generated_path") or session.get("audio_path")
+        audio_path = session.audio_generated_path or session.audio_path
         if not audio_path:
             raise ValueError("No audio file available for rendering")
 
         pipeline = Pipeline(
             settings=settings,
-            text_path=session["text_path"],
+            text_path=session.text_path,
             audio_path=audio_path,
             output_path=output_path,
             progress_callback=progress_callback,
         )
 
         # Only run the render step since we already have chunks_with_timings
-        video_path = pipeline.render(session["chunks_with_timings"], audio_path)
+        video_path = pipeline.render(session.chunks_with_timings, audio_path)
 
         job["video_path"] = video_path
-        session["video_path"] = video_path
+        session.video_path = video_path
         job["status"] = "complete"
 
     except Exception as exc:
@@ -540,7 +801,8 @@ def _run_export(job_id: str) -> None:
         job["error"] = str(exc)
 
     finally:
-        done_event.set()
+        job["finished_at"] = time.monotonic()
+        _push_progress(job, None)
 
 
 @app.get("/api/export/progress/{job_id}")
@@ -550,30 +812,16 @@ async def export_progress(job_id: str):
         raise HTTPException(status_code=404, detail=f"Export job {job_id} not found")
 
     job = export_jobs[job_id]
-    done_event = job["done_event"]
 
     async def event_generator():
-        idx = 0
-        while not done_event.is_set():
-            await asyncio.sleep(0.15)
-            events = job["progress_events"]
-            while idx < len(events):
-                evt = events[idx]
-                idx += 1
-                yield f"event: progress\ndata: {json.dumps(evt)}\n\n"
-
-        # Drain remaining events
-        events = job["progress_events"]
-        while idx < len(events):
-            evt = events[idx]
-            idx += 1
-            yield f"event: progress\ndata: {json.dumps(evt)}\n\n"
+        async for chunk in _progress_stream(job["progress_queue"]):
+            yield chunk
 
         if job["status"] == "error":
-            yield f"event: error\ndata: {json.dumps({'error': job['error']})}\n\n"
+            yield _sse("error", {"error": job["error"]})
         else:
             session_id = job["session_id"]
-            yield f"event: complete\ndata: {json.dumps({'download_url': f'/api/video/{session_id}'})}\n\n"
+            yield _sse("complete", {"download_url": f"/api/video/{session_id}"})
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -587,15 +835,15 @@ async def get_timestamps(session_id: str):
     """Return word timestamps and chunks as JSON for the player."""
     session = _get_session(session_id)
 
-    if session["chunks_with_timings"] is None:
+    if session.chunks_with_timings is None:
         raise HTTPException(status_code=400, detail="Session has not been processed yet")
 
     return {
-        "chunks_with_timings": session["chunks_with_timings"],
-        "chunks": session["chunks"],
-        "duration": session["duration"],
-        "formatting": session.get("formatting", {}),
-        "chapters": session.get("chapters"),
+        "chunks_with_timings": session.chunks_with_timings,
+        "chunks": session.chunks,
+        "duration": session.duration,
+        "formatting": session.formatting,
+        "chapters": session.chapters,
     }
 
 
@@ -603,27 +851,47 @@ async def get_timestamps(session_id: str):
 # GET /api/audio/{session_id}  --  Serve the audio file
 # ---------------------------------------------------------------------------
 
+def _stat_or_none(path: str | None) -> os.stat_result | None:
+    """
+    stat() a file to be served, or None if it doesn't exist.
+
+    The result is handed to FileResponse so it doesn't stat the file again.
+    FileResponse answers Range requests itself (Starlette >= 0.39, hence the
+    fastapi floor in requirements), which lets the player seek without
+    re-downloading.
+    """
+    if not path:
+        return None
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+_AUDIO_MEDIA_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".ogg": "audio/ogg",
+    ".flac": "audio/flac",
+    ".aac": "audio/aac",
+}
+
+
 @app.get("/api/audio/{session_id}")
 async def get_audio(session_id: str):
     """Serve the audio file (generated or uploaded)."""
     session = _get_session(session_id)
 
-    audio_path = session.get("audio_generated_path") or session.get("audio_path")
-    if not audio_path or not Path(audio_path).exists():
+    audio_path = session.audio_generated_path or session.audio_path
+    st = _stat_or_none(audio_path)
+    if st is None:
         raise HTTPException(status_code=404, detail="Audio file not found")
 
-    suffix = Path(audio_path).suffix.lower()
-    media_types = {
-        ".mp3": "audio/mpeg",
-        ".wav": "audio/wav",
-        ".m4a": "audio/mp4",
-        ".ogg": "audio/ogg",
-        ".flac": "audio/flac",
-        ".aac": "audio/aac",
-    }
-    media_type = media_types.get(suffix, "audio/mpeg")
+    suffix = os.path.splitext(audio_path)[1].lower()
+    media_type = _AUDIO_MEDIA_TYPES.get(suffix, "audio/mpeg")
 
-    return FileResponse(audio_path, media_type=media_type, filename=f"audio{suffix}")
+    return FileResponse(audio_path, media_type=media_type, filename=f"audio{suffix}", stat_result=st)
 
 
 # ---------------------------------------------------------------------------
@@ -635,11 +903,12 @@ async def get_video(session_id: str):
     """Serve the rendered MP4 video."""
     session = _get_session(session_id)
 
-    video_path = session.get("video_path")
-    if not video_path or not Path(video_path).exists():
+    video_path = session.video_path
+    st = _stat_or_none(video_path)
+    if st is None:
         raise HTTPException(status_code=404, detail="Video not found; export it first")
 
-    return FileResponse(video_path, media_type="video/mp4", filename="karaoke.mp4")
+    return FileResponse(video_path, media_type="video/mp4", filename="karaoke.mp4", stat_result=st)
 
 
 # ---------------------------------------------------------------------------
@@ -651,11 +920,11 @@ async def get_srt(session_id: str):
     """Generate and serve an SRT subtitle file."""
     session = _get_session(session_id)
 
-    if not session["chunks_with_timings"]:
+    if not session.chunks_with_timings:
         raise HTTPException(status_code=400, detail="No timestamp data; process the session first")
 
-    srt_path = str(Path(session["work_dir"]) / "karaoke.srt")
-    export_srt(session["chunks_with_timings"], srt_path)
+    srt_path = str(Path(session.work_dir) / "karaoke.srt")
+    export_srt(session.chunks_with_timings, srt_path)
 
     return FileResponse(srt_path, media_type="text/plain", filename="karaoke.srt")
 
@@ -669,11 +938,11 @@ async def get_vtt(session_id: str):
     """Generate and serve a WebVTT subtitle file."""
     session = _get_session(session_id)
 
-    if not session["chunks_with_timings"]:
+    if not session.chunks_with_timings:
         raise HTTPException(status_code=400, detail="No timestamp data; process the session first")
 
-    vtt_path = str(Path(session["work_dir"]) / "karaoke.vtt")
-    export_vtt(session["chunks_with_timings"], vtt_path)
+    vtt_path = str(Path(session.work_dir) / "karaoke.vtt")
+    export_vtt(session.chunks_with_timings, vtt_path)
 
     return FileResponse(vtt_path, media_type="text/vtt", filename="karaoke.vtt")
 
@@ -682,33 +951,52 @@ async def get_vtt(session_id: str):
 # GET /api/export/html/{session_id}  --  Export standalone HTML
 # ---------------------------------------------------------------------------
 
+def _clear_html_exports(work_dir: str) -> None:
+    """Delete cached standalone HTML exports in *work_dir*."""
+    for path in Path(work_dir).glob("karaoke-*.html"):
+        path.unlink(missing_ok=True)
+
+
 @app.get("/api/export/html/{session_id}")
 async def get_html(session_id: str):
     """Generate and serve a self-contained HTML karaoke player."""
     session = _get_session(session_id)
 
-    if not session["chunks_with_timings"]:
+    if not session.chunks_with_timings:
         raise HTTPException(status_code=400, detail="No timestamp data; process the session first")
 
-    audio_path = session.get("audio_generated_path") or session.get("audio_path")
-    if not audio_path or not Path(audio_path).exists():
+    audio_path = session.audio_generated_path or session.audio_path
+    audio_st = _stat_or_none(audio_path)
+    if audio_st is None:
         raise HTTPException(status_code=404, detail="Audio file not found")
 
-    title = _title_from_text(session.get("text") or session["id"])
-
-    html_content = generate_standalone_html(
-        title=title,
-        chunks_with_timings=session["chunks_with_timings"],
-        formatting=session.get("formatting", {}),
-        audio_path=audio_path,
-        duration=session.get("duration", 0),
-    )
-
-    # Save to project dir and serve
-    html_path = Path(session["work_dir"]) / "karaoke.html"
-    html_path.write_text(html_content)
+    title = session.title or session.id
+
+    # The page is a pure function of these inputs, so it is generated once
+    # per distinct set and kept in the project dir under their digest.
+    key = hashlib.blake2b(_json_bytes([
+        title,
+        session.chunks_with_timings,
+        session.formatting,
+        session.duration,
+        audio_path,
+        audio_st.st_size,
+        audio_st.st_mtime_ns,
+    ]), digest_size=8).hexdigest()
+    html_path = Path(session.work_dir) / f"karaoke-{key}.html"
+
+    if not html_path.exists():
+        html_content = generate_standalone_html(
+            title=title,
+            chunks_with_timings=session.chunks_with_timings,
+            formatting=session.formatting,
+            audio_path=audio_path,
+            duration=session.duration,
+        )
+        _clear_html_exports(session.work_dir)
+        html_path.write_text(html_content)
 
-    slug = session["id"]
+    slug = session.id
     filename = f"{slug}.html"
 
     return FileResponse(
@@ -726,44 +1014,46 @@ async def get_html(session_id: str):
 @app.get("/api/projects")
 async def list_projects():
     """Return a list of all saved projects (for the library view)."""
-    projects = []
-    for sid, session in sessions.items():
-        if session["status"] != "ready":
+    projects: dict[str, dict] = {}
+    for session in list(sessions.values()):
+        if session.status != "ready":
             continue
-        projects.append({
-            "id": session["id"],
-            "title": _title_from_text(session.get("text") or ""),
-            "preview": (session.get("text") or "")[:120].replace("\n", " ").strip(),
-            "duration": session.get("duration"),
-            "created_at": session.get("created_at"),
-            "word_count": len((session.get("text") or "").split()) if session.get("text") else None,
-        })
+        projects[session.id] = {
+            "id": session.id,
+            "title": session.title or "",
+            "preview": session.preview or "",
+            "duration": session.duration,
+            "created_at": session.created_at,
+            "word_count": session.word_count,
+        }
 
     # Also read from disk for projects where text wasn't loaded into memory
-    for project_dir in sorted(PROJECTS_DIR.iterdir()):
-        meta_path = project_dir / "project.json"
-        if not meta_path.exists():
-            continue
-        slug = project_dir.name
+    for entry in _project_dirs():
+        slug = entry.name
         # Skip if already in the list from sessions
-        if any(p["id"] == slug for p in projects):
+        if slug in projects:
             continue
         try:
-            meta = json.loads(meta_path.read_text())
-            projects.append({
+            meta = _read_project_meta(entry.path)
+            if meta is None:
+                continue
+            projects[slug] = {
                 "id": meta["id"],
                 "title": meta.get("title", slug),
                 "preview": meta.get("preview", ""),
                 "duration": meta.get("duration"),
                 "created_at": meta.get("created_at"),
                 "word_count": meta.get("word_count"),
-            })
+            }
         except Exception:
             pass
 
     # Sort newest first
-    projects.sort(key=lambda p: p.get("created_at") or "", reverse=True)
-    return {"projects": projects}
+    return {
+        "projects": sorted(
+            projects.values(), key=lambda p: p.get("created_at") or "", reverse=True,
+        ),
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -4,10 +4,7 @@ Audio transcription using local Whisper (mlx-whisper on Apple Silicon).
 
 from pathlib import Path
 
-import mlx_whisper
-
-# Same model as align.py for consistency
-DEFAULT_MODEL = "mlx-community/whisper-large-v3-turbo"
+from .align import whisper_transcribe
 
 
 def transcribe_audio(audio_path: str, progress_callback=None) -> str:
@@ -34,10 +31,7 @@ def transcribe_audio(audio_path: str, progress_callback=None) -> str:
 
     _report(f"Transcribing {audio_path} ({file_size / 1024:.1f} KB) with local Whisper...")
 
-    result = mlx_whisper.transcribe(
-        audio_path,
-        path_or_hf_repo=DEFAULT_MODEL,
-    )
+    result = whisper_transcribe(audio_path)
 
     text = result.get("text", "").strip()
 
@@ -6,10 +6,13 @@ For long texts, splits into chunks and reports per-chunk progress.
 """
 
 import asyncio
+import atexit
+import hashlib
 import os
 import re
-import sys
+import shutil
 import tempfile
+import threading
 from pathlib import Path
 
 import edge_tts
@@ -33,12 +36,34 @@ DEFAULT_VOICE = "andrew"
 # Split long text into chunks of this size for progress reporting
 CHUNK_SIZE = 4000
 
+# Buffer size for streaming MP3 segments into the final file
+COPY_BUFSIZE = 1 << 20
+
+# How many chunk requests to have in flight at once; lower it if throttled
+TTS_CONCURRENCY = max(1, int(os.environ.get("TTS_CONCURRENCY", "5")))
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Generated chunks are kept on disk keyed by voice + text, so re-running a
+# book (or a chapter) doesn't hit the throttled endpoint again. Set
+# BK_TTS_CACHE to another directory, or to an empty string to disable it.
+_cache_env = os.environ.get("BK_TTS_CACHE", str(Path.home() / ".cache" / "book-karaoke" / "tts"))
+TTS_CACHE_DIR = Path(_cache_env) if _cache_env else None
+# Least recently used entries are evicted beyond this size
+TTS_CACHE_MAX_BYTES = int(os.environ.get("BK_TTS_CACHE_MB", "1024")) * 1024 * 1024
+
+
+# Friendly names plus the voice IDs they map to, so either resolves in one
+# dict hit (IDs map to themselves)
+_VOICE_LOOKUP = {**VOICE_MAP, **{voice_id: voice_id for voice_id in VOICE_MAP.values()}}
+
 
 def _resolve_voice(voice: str) -> str:
     """Resolve a friendly voice name to an edge-tts voice ID."""
-    lower = voice.lower().strip()
-    if lower in VOICE_MAP:
-        return VOICE_MAP[lower]
+    resolved = _VOICE_LOOKUP.get(voice) or _VOICE_LOOKUP.get(voice.lower().strip())
+    if resolved:
+        return resolved
+    # Any other edge-tts voice ID is passed through as-is
     if "-" in voice and "Neural" in voice:
         return voice
     return VOICE_MAP[DEFAULT_VOICE]
@@ -49,30 +74,43 @@ def _split_text(text: str, max_chars: int = CHUNK_SIZE) -> list[str]:
     if len(text) <= max_chars:
         return [text]
 
-    sentences = re.split(r'(?<=[.!?])\s+', text)
     chunks = []
-    current = ""
+    # Pieces of the chunk being built, joined only when it is flushed;
+    # current_len tracks len(" ".join(current)).
+    current: list[str] = []
+    current_len = 0
+
+    def add(piece: str) -> None:
+        nonlocal current, current_len
+        if current_len:
+            current.append(piece)
+            current_len += len(piece) + 1
+        else:
+            current = [piece]
+            current_len = len(piece)
+
+    def flush() -> None:
+        nonlocal current, current_len
+        chunks.append(" ".join(current).strip())
+        current = []
+        current_len = 0
 
-    for sentence in sentences:
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
         if len(sentence) > max_chars:
-            if current:
-                chunks.append(current.strip())
-                current = ""
-            words = sentence.split()
-            for word in words:
-                if len(current) + len(word) + 1 > max_chars:
-                    chunks.append(current.strip())
-                    current = word
-                else:
-                    current = f"{current} {word}" if current else word
-        elif len(current) + len(sentence) + 1 > max_chars:
-            chunks.append(current.strip())
-            current = sentence
+            if current_len:
+                flush()
+            for word in sentence.split():
+                if current_len + len(word) + 1 > max_chars:
+                    flush()
+                add(word)
         else:
-            current = f"{current} {sentence}" if current else sentence
+            if current_len + len(sentence) + 1 > max_chars:
+                flush()
+            add(sentence)
 
-    if current.strip():
-        chunks.append(current.strip())
+    tail = " ".join(current).strip()
+    if tail:
+        chunks.append(tail)
 
     return chunks
 
@@ -80,13 +118,99 @@ def _split_text(text: str, max_chars: int = CHUNK_SIZE) -> list[str]:
 MAX_RETRIES = 3
 
 
-async def _generate_one(text: str, voice_id: str, output_path: str) -> None:
-    """Generate a single TTS segment with retry on transient errors."""
+# ---------------------------------------------------------------------------
+# On-disk segment cache
+# ---------------------------------------------------------------------------
+
+def _cache_path(text: str, voice_id: str) -> Path | None:
+    """Return the cache file for this voice + text (None if caching is off)."""
+    if TTS_CACHE_DIR is None:
+        return None
+    key = hashlib.sha256(f"{voice_id}\x00{text}".encode()).hexdigest()
+    return TTS_CACHE_DIR / f"{key}.mp3"
+
+
+def _cache_load(cached: Path | None) -> bytes | None:
+    """Return a cached segment's MP3 bytes, or None on a miss."""
+    if cached is None:
+        return None
+    try:
+        data = cached.read_bytes()
+        os.utime(cached)  # mark as recently used for eviction
+    except OSError:
+        return None
+    return data
+
+
+def _cache_store(cached: Path | None, data: bytes) -> None:
+    """Publish a freshly generated segment into the cache atomically."""
+    if cached is None:
+        return
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cached.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, cached)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as exc:
+        _log(f"[tts] Could not cache segment: {exc}")
+
+
+def _prune_cache() -> None:
+    """Delete least recently used cache entries beyond TTS_CACHE_MAX_BYTES."""
+    if TTS_CACHE_DIR is None:
+        return
+    try:
+        entries = []
+        with os.scandir(TTS_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".mp3"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    if total <= TTS_CACHE_MAX_BYTES:
+        return
+    for _, size, path in sorted(entries):
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= TTS_CACHE_MAX_BYTES:
+            break
+
+
+async def _generate_one(text: str, voice_id: str) -> bytes:
+    """Generate a single TTS segment's MP3 bytes, retrying transient errors.
+
+    Audio is collected from the edge-tts stream in memory rather than via a
+    temp file. Segments already generated for the same voice and text come
+    from the on-disk cache instead of being requested again.
+    """
+    cached = _cache_path(text, voice_id)
+    data = _cache_load(cached)
+    if data is not None:
+        return data
+
     for attempt in range(1, MAX_RETRIES + 1):
         try:
+            # Each request is its own WebSocket, so there is no connection
+            # to share between chunks; concurrency (TTS_CONCURRENCY) is what
+            # hides the per-chunk handshake.
             communicate = edge_tts.Communicate(text, voice_id)
-            await communicate.save(output_path)
-            return
+            sink = bytearray()
+            async for message in communicate.stream():
+                if message["type"] == "audio":
+                    sink += message["data"]
+            data = bytes(sink)
+            _cache_store(cached, data)
+            return data
         except Exception as exc:
             if attempt < MAX_RETRIES:
                 wait = attempt * 2
@@ -106,57 +230,89 @@ async def _generate_all(
     total = len(chunks)
 
     if total == 1:
-        await _generate_one(chunks[0], voice_id, output_path)
+        data = await _generate_one(chunks[0], voice_id)
+        with open(output_path, "wb") as out:
+            out.write(data)
     else:
-        tmp_dir = tempfile.mkdtemp(prefix="tts_segments_")
-        segment_paths = []
+        # Chunks are independent requests, so several run concurrently.
+        # Finished segments wait in `pending` until every earlier one has
+        # been written, so the output is in order and only the out-of-order
+        # window is held in memory.
+        sem = asyncio.Semaphore(TTS_CONCURRENCY)
+
+        async def generate(i: int) -> tuple[int, bytes]:
+            async with sem:
+                _log(f"[tts] Chunk {i + 1}/{total} ({len(chunks[i])} chars)...")
+                return i, await _generate_one(chunks[i], voice_id)
+
+        pending: dict[int, bytes] = {}
+        next_i = 0
+        tasks = [asyncio.ensure_future(generate(i)) for i in range(total)]
+        try:
+            with open(output_path, "wb") as out:
+                for done, finished in enumerate(asyncio.as_completed(tasks), start=1):
+                    i, data = await finished
+                    pending[i] = data
+                    while next_i in pending:
+                        out.write(pending.pop(next_i))
+                        next_i += 1
+                    if progress_callback and done < total:
+                        progress_callback("tts", done / total, f"Generating speech ({done}/{total})...")
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancellations to land now (closing their
+            # connections) rather than on this thread's next TTS call, and
+            # retrieve the other failures so they aren't logged as unhandled
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Don't leave a truncated MP3 behind
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+            raise
+
+    _prune_cache()
+    return output_path
 
-        for i, chunk in enumerate(chunks):
-            pct = i / total
-            _log(f"[tts] Chunk {i + 1}/{total} ({len(chunk)} chars)...")
 
-            if progress_callback:
-                progress_callback("tts", pct, f"Generating speech ({i + 1}/{total})...")
+def _log(msg: str) -> None:
+    """Print and flush immediately."""
+    print(msg, flush=True)
 
-            seg_path = os.path.join(tmp_dir, f"seg_{i:03d}.mp3")
-            await _generate_one(chunk, voice_id, seg_path)
-            segment_paths.append(seg_path)
 
-        # Concatenate MP3 segments
-        with open(output_path, "wb") as out:
-            for p in segment_paths:
-                out.write(Path(p).read_bytes())
+# One event loop per calling thread, reused across TTS calls (a chapter
+# book makes one call per chapter) instead of built and torn down each time
+_thread_state = threading.local()
+_loops: list[asyncio.AbstractEventLoop] = []
+_loops_lock = threading.Lock()
 
-        # Cleanup
-        for p in segment_paths:
-            os.unlink(p)
-        os.rmdir(tmp_dir)
 
-    return output_path
+def _thread_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's TTS event loop, creating it on first use."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+        with _loops_lock:
+            _loops.append(loop)
+    return loop
 
 
-def _log(msg: str) -> None:
-    """Print and flush immediately."""
-    print(msg, flush=True)
+@atexit.register
+def _close_loops() -> None:
+    with _loops_lock:
+        for loop in _loops:
+            if not loop.is_closed() and not loop.is_running():
+                loop.close()
+        _loops.clear()
 
 
 def _run_async(coro):
-    """Run an async coroutine, creating a new event loop if needed."""
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-
-    if loop and loop.is_running():
-        # We're inside an existing event loop (e.g. FastAPI thread) —
-        # create a fresh loop in this thread.
-        new_loop = asyncio.new_event_loop()
-        try:
-            return new_loop.run_until_complete(coro)
-        finally:
-            new_loop.close()
-    else:
-        return asyncio.run(coro)
+    """Run an async coroutine to completion on this thread's event loop.
+
+    Callers are synchronous (the CLI, or pipeline worker threads), so the
+    thread never has a loop of its own running here.
+    """
+    return _thread_loop().run_until_complete(coro)
 
 
 def generate_tts_segment(
@@ -173,12 +329,70 @@ def generate_tts_segment(
     return output_path
 
 
+def _id3v2_size(head: bytes) -> int:
+    """Return the byte length of a leading ID3v2 tag (0 if there is none)."""
+    if len(head) < 10 or head[:3] != b"ID3":
+        return 0
+    # Tag size is a 28-bit "syncsafe" integer (7 bits per byte)
+    size = (head[6] & 0x7F) << 21 | (head[7] & 0x7F) << 14 | (head[8] & 0x7F) << 7 | (head[9] & 0x7F)
+    return 10 + size
+
+
+def _kernel_copies():
+    """In-kernel file-to-file copy primitives available here, best first.
+
+    Each is called as ``copy(in_fd, out_fd, offset, count)`` and writes at
+    the output's current position.
+    """
+    copies = []
+    if hasattr(os, "copy_file_range"):
+        copies.append(lambda i, o, off, n: os.copy_file_range(i, o, n, offset_src=off))
+    if hasattr(os, "sendfile"):
+        copies.append(lambda i, o, off, n: os.sendfile(o, i, off, n))
+    return copies
+
+
+_KERNEL_COPIES = _kernel_copies()
+
+
+def _append_file(src, out, offset: int) -> None:
+    """Append ``src`` from ``offset`` to the end onto ``out``.
+
+    Uses ``os.copy_file_range`` (Linux) so the kernel copies page-cache
+    pages directly, then ``os.sendfile`` (older kernels, or where the
+    filesystem refuses copy_file_range, e.g. EXDEV across mounts); falls
+    back to a user-space copy where neither works (macOS only sendfiles
+    to sockets, Windows has neither).
+    """
+    remaining = os.fstat(src.fileno()).st_size - offset
+    if _KERNEL_COPIES:
+        out.flush()
+    for copy in _KERNEL_COPIES:
+        try:
+            while remaining > 0:
+                n = copy(src.fileno(), out.fileno(), offset, remaining)
+                if n == 0:
+                    break
+                offset += n
+                remaining -= n
+            return
+        except OSError:
+            continue
+    src.seek(offset)
+    shutil.copyfileobj(src, out, COPY_BUFSIZE)
+
+
 def concatenate_mp3_files(segment_paths: list[str], output_path: str) -> str:
-    """Binary-append MP3 files into one. MP3 is frame-based so this is valid."""
+    """Binary-append MP3 files into one. MP3 is frame-based so this is valid.
+
+    Each segment is stream-copied (no decode/re-encode) with any leading
+    ID3v2 tag skipped, so tags don't end up in the middle of the stream.
+    """
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "wb") as out:
         for p in segment_paths:
-            out.write(Path(p).read_bytes())
+            with open(p, "rb") as src:
+                _append_file(src, out, _id3v2_size(src.read(10)))
     _log(f"[tts] Concatenated {len(segment_paths)} segments -> {output_path}")
     return output_path
 
@@ -201,7 +415,10 @@ def generate_tts(
     total = len(chunks)
 
     _log(f"[tts] Generating speech with edge-tts, voice={voice_id}")
-    _log(f"[tts] Text length: {len(text)} chars, ~{len(text.split())} words, {total} chunk(s)")
+    # Word count is for the log only; counting separators avoids building
+    # a list of every word in the book
+    approx_words = text.count(" ") + text.count("\n") + 1
+    _log(f"[tts] Text length: {len(text)} chars, ~{approx_words} words, {total} chunk(s)")
 
     if progress_callback:
         progress_callback("tts", 0.0, f"Generating speech ({voice})...")
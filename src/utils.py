@@ -5,7 +5,10 @@ Utility functions for Book Karaoke: text chunking, font loading, and helpers.
 import os
 import re
 import platform
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
+
 from PIL import ImageFont
 
 
@@ -50,39 +53,130 @@ _BOLD_FONT_CANDIDATES = [
     "C:/Windows/Fonts/segoeuib.ttf",
 ]
 
+# Where each OS keeps the candidates above; anything else (Linux, BSD)
+# uses the /usr/share paths
+_FONT_DIR_PREFIXES = {
+    "Darwin": ("/System/", "/Library/"),
+    "Windows": ("C:/",),
+}
+
+
+def _platform_candidates(paths: list[str]) -> list[str]:
+    """Keep only the candidates that can exist on this OS."""
+    prefixes = _FONT_DIR_PREFIXES.get(platform.system(), ("/usr/",))
+    return [p for p in paths if p.startswith(prefixes)] or paths
+
+
+_FONT_CANDIDATES = _platform_candidates(_FONT_CANDIDATES)
+_BOLD_FONT_CANDIDATES = _platform_candidates(_BOLD_FONT_CANDIDATES)
+
+
+def _scan_project_fonts() -> tuple[str, ...]:
+    """Font files in the project's fonts/ directory, in name order."""
+    project_fonts = Path(__file__).parent.parent / "fonts"
+    if not project_fonts.is_dir():
+        return ()
+    return tuple(
+        str(f) for f in sorted(project_fonts.iterdir())
+        if f.suffix.lower() in (".ttf", ".otf", ".ttc")
+    )
+
+
+# User-supplied fonts take precedence over system ones; scanned once
+_PROJECT_FONTS = _scan_project_fonts()
 
+
+@lru_cache(maxsize=64)
 def find_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     """
     Find the best available system font and return it at the requested size.
     Falls back to Pillow's built-in default if nothing else works.
+
+    Fonts are cached per (size, bold), so repeated lookups are a dict hit.
     """
+    path = _font_path(bold)
+    if path is not None:
+        try:
+            return ImageFont.truetype(path, size)
+        except Exception:
+            pass
+
+    # Last resort: Pillow default (bitmap, not pretty but functional)
+    print("[warn] No system TrueType font found, using Pillow default bitmap font.")
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=None)
+def _font_path(bold: bool) -> str | None:
+    """Return the first font file that loads, probing the filesystem once."""
     # Check project fonts/ directory first
-    project_fonts = Path(__file__).parent.parent / "fonts"
-    if project_fonts.exists():
-        for f in sorted(project_fonts.iterdir()):
-            if f.suffix.lower() in (".ttf", ".otf", ".ttc"):
-                try:
-                    return ImageFont.truetype(str(f), size)
-                except Exception:
-                    continue
-
-    candidates = _BOLD_FONT_CANDIDATES if bold else _FONT_CANDIDATES
+    candidates = [*_PROJECT_FONTS, *(_BOLD_FONT_CANDIDATES if bold else _FONT_CANDIDATES)]
+
     for path in candidates:
         if os.path.exists(path):
             try:
-                return ImageFont.truetype(path, size)
+                ImageFont.truetype(path, 12)
+                return path
             except Exception:
                 continue
-
-    # Last resort: Pillow default (bitmap, not pretty but functional)
-    print("[warn] No system TrueType font found, using Pillow default bitmap font.")
-    return ImageFont.load_default()
+    return None
 
 
 # ---------------------------------------------------------------------------
 # Text chunking — splits text into display chunks of ~2-3 short lines
 # ---------------------------------------------------------------------------
 
+# Markdown syntax removed by strip_markdown, applied in order. Each rule
+# carries a literal its pattern cannot match without (None = always run),
+# so passes for syntax the text doesn't use are skipped.
+_MARKDOWN_RULES = [
+    # Code blocks (``` ... ```)
+    ("```", re.compile(r"```[\s\S]*?```"), ""),
+    # Inline code (`...`)
+    ("`", re.compile(r"`([^`]+)`"), r"\1"),
+    # Images ![alt](url)
+    ("![", re.compile(r"!\[([^\]]*)\]\([^)]+\)"), r"\1"),
+    # Links [text](url) — keep the text
+    ("](", re.compile(r"\[([^\]]+)\]\([^)]+\)"), r"\1"),
+    # Strikethrough ~~text~~
+    ("~~", re.compile(r"~~(.+?)~~"), r"\1"),
+    # Bold/italic markers (order matters: ** before *)
+    ("***", re.compile(r"\*\*\*(.+?)\*\*\*"), r"\1"),
+    ("**", re.compile(r"\*\*(.+?)\*\*"), r"\1"),
+    ("*", re.compile(r"\*(.+?)\*"), r"\1"),
+    ("___", re.compile(r"___(.+?)___"), r"\1"),
+    ("__", re.compile(r"__(.+?)__"), r"\1"),
+    ("_", re.compile(r"(?<!\w)_(.+?)_(?!\w)"), r"\1"),
+    # Heading markers
+    ("#", re.compile(r"^#{1,6}\s+", re.MULTILINE), ""),
+    # Blockquote markers
+    (">", re.compile(r"^>\s*", re.MULTILINE), ""),
+    # Horizontal rules
+    (None, re.compile(r"^[-*_]{3,}\s*$", re.MULTILINE), ""),
+    # List markers (-, *, numbered)
+    (None, re.compile(r"^[\s]*[-*+]\s+", re.MULTILINE), ""),
+    (None, re.compile(r"^[\s]*\d+\.\s+", re.MULTILINE), ""),
+]
+
+# Matches wherever any rule above could: an inline marker character, or a
+# line starting with a list bullet, numbered item or rule dash. Prose with
+# none of these skips markdown handling entirely.
+_MD_SNIFF_RE = re.compile(r"[`*_#>~\[]|^\s*(?:[-+]|\d+\.)", re.MULTILINE)
+
+_BOLD_ITALIC_RE = re.compile(r"\*\*\*(.+?)\*\*\*|___(.+?)___")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*|__(.+?)__")
+_ITALIC_RE = re.compile(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)|(?<!\w)_(.+?)_(?!\w)")
+_MULTISPACE_RE = re.compile(r"  +")
+_MULTINEWLINE_RE = re.compile(r"\n{3,}")
+# Everything normalize_word drops
+_NON_WORD_RE = re.compile(r"[^a-zA-Z0-9']")
+# The same, but keeping whitespace so a whole span normalizes at once
+_NON_WORD_SPACE_RE = re.compile(r"[^a-zA-Z0-9'\s]")
+# Sentence-ending punctuation and closing quotes, the following space, and
+# (captured) the next word's first character after its opening quotes
+_SENTENCE_END_RE = re.compile(r"""[.?!]\u2019*\u201d*'*"* (?="*'*\u201c*\u2018*(\S?))""")
+
+
 def strip_markdown(text: str) -> str:
     """Remove markdown formatting syntax while preserving the content.
 
@@ -90,32 +184,11 @@ def strip_markdown(text: str) -> str:
     > blockquotes, - list items, [links](url), ![images](url),
     ~~strikethrough~~, `inline code`, ``` code blocks ```
     """
-    # Remove code blocks (``` ... ```)
-    text = re.sub(r"```[\s\S]*?```", "", text)
-    # Remove inline code (`...`)
-    text = re.sub(r"`([^`]+)`", r"\1", text)
-    # Remove images ![alt](url)
-    text = re.sub(r"!\[([^\]]*)\]\([^)]+\)", r"\1", text)
-    # Remove links [text](url) — keep the text
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-    # Remove strikethrough ~~text~~
-    text = re.sub(r"~~(.+?)~~", r"\1", text)
-    # Remove bold/italic markers (order matters: ** before *)
-    text = re.sub(r"\*\*\*(.+?)\*\*\*", r"\1", text)
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r"\*(.+?)\*", r"\1", text)
-    text = re.sub(r"___(.+?)___", r"\1", text)
-    text = re.sub(r"__(.+?)__", r"\1", text)
-    text = re.sub(r"(?<!\w)_(.+?)_(?!\w)", r"\1", text)
-    # Remove heading markers
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
-    # Remove blockquote markers
-    text = re.sub(r"^>\s*", "", text, flags=re.MULTILINE)
-    # Remove horizontal rules
-    text = re.sub(r"^[-*_]{3,}\s*$", "", text, flags=re.MULTILINE)
-    # Remove list markers (-, *, numbered)
-    text = re.sub(r"^[\s]*[-*+]\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^[\s]*\d+\.\s+", "", text, flags=re.MULTILINE)
+    if not _MD_SNIFF_RE.search(text):
+        return text
+    for marker, pattern, repl in _MARKDOWN_RULES:
+        if marker is None or marker in text:
+            text = pattern.sub(repl, text)
     return text
 
 
@@ -126,33 +199,41 @@ def extract_formatting(text: str) -> dict[str, str]:
     format strings: 'bold', 'italic', or 'bold-italic'.
     Words not in the dict have no special formatting.
     """
+    if not _MD_SNIFF_RE.search(text):
+        return {}
+
     fmt = {}
 
     # Bold+italic ***word*** or ___word___
-    for m in re.finditer(r"\*\*\*(.+?)\*\*\*|___(.+?)___", text):
-        content = m.group(1) or m.group(2)
-        for w in content.split():
-            fmt[re.sub(r"[^a-zA-Z0-9']", "", w).lower()] = "bold-italic"
+    for m in _BOLD_ITALIC_RE.finditer(text):
+        for key in _span_keys(m.group(1) or m.group(2)):
+            fmt[key] = "bold-italic"
 
     # Bold **word** or __word__
-    for m in re.finditer(r"\*\*(.+?)\*\*|__(.+?)__", text):
-        content = m.group(1) or m.group(2)
-        for w in content.split():
-            key = re.sub(r"[^a-zA-Z0-9']", "", w).lower()
+    for m in _BOLD_RE.finditer(text):
+        for key in _span_keys(m.group(1) or m.group(2)):
             if key not in fmt:
                 fmt[key] = "bold"
 
     # Italic *word* or _word_
-    for m in re.finditer(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)|(?<!\w)_(.+?)_(?!\w)", text):
-        content = m.group(1) or m.group(2)
-        for w in content.split():
-            key = re.sub(r"[^a-zA-Z0-9']", "", w).lower()
+    for m in _ITALIC_RE.finditer(text):
+        for key in _span_keys(m.group(1) or m.group(2)):
             if key not in fmt:
                 fmt[key] = "italic"
 
     return fmt
 
 
+def _span_keys(content: str) -> list[str]:
+    """Return normalize_word() of each word in *content*, in one regex pass."""
+    keys = _NON_WORD_SPACE_RE.sub("", content).lower().split()
+    words = content.split()
+    if len(keys) != len(words):
+        # A punctuation-only word normalizes to "" and must keep its slot
+        keys = [normalize_word(w) for w in words]
+    return keys
+
+
 def clean_text(text: str) -> str:
     """Normalize whitespace, strip markdown syntax, and clean the text."""
     text = text.strip()
@@ -161,9 +242,9 @@ def clean_text(text: str) -> str:
     # Normalize various dash types to standard em-dash
     text = text.replace("—", " -- ")
     # Collapse multiple spaces
-    text = re.sub(r"  +", " ", text)
+    text = _MULTISPACE_RE.sub(" ", text)
     # Collapse multiple newlines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _MULTINEWLINE_RE.sub("\n\n", text)
     return text
 
 
@@ -172,32 +253,22 @@ def split_into_sentences(text: str) -> list[str]:
     Split text into sentences. Handles common abbreviations and quoted speech.
     Returns a list of sentence strings (with trailing space stripped).
     """
-    # Simple sentence boundary detection
-    # Split on period/question/exclamation followed by space and uppercase, or end of string
-    # But be careful with quotes
+    # A boundary is a word ending in . ? or ! (past any closing quotes)
+    # followed by a word whose first character past any opening quotes is
+    # uppercase or an opening curly quote. Whitespace is normalized first,
+    # so the regex walks the text once instead of probing word by word.
+    text = " ".join(text.split())
     sentences = []
-    current = []
-    words = text.split()
-
-    for i, word in enumerate(words):
-        current.append(word)
-        # Check if this word ends a sentence
-        stripped = word.rstrip('"').rstrip("'").rstrip("\u201d").rstrip("\u2019")
-        if stripped and stripped[-1] in ".?!":
-            # Check if next word starts with uppercase or we're at the end
-            if i == len(words) - 1:
-                sentences.append(" ".join(current))
-                current = []
-            elif i + 1 < len(words):
-                next_word = words[i + 1]
-                # Strip opening quotes
-                next_clean = next_word.lstrip('"').lstrip("'").lstrip("\u201c").lstrip("\u2018")
-                if next_clean and (next_clean[0].isupper() or next_clean[0] == "\u201c"):
-                    sentences.append(" ".join(current))
-                    current = []
-
-    if current:
-        sentences.append(" ".join(current))
+    start = 0
+
+    for m in _SENTENCE_END_RE.finditer(text):
+        first = m.group(1)
+        if first and (first.isupper() or first == "\u201c"):
+            sentences.append(text[start:m.end() - 1])
+            start = m.end()
+
+    if start < len(text):
+        sentences.append(text[start:])
 
     return sentences
 
@@ -208,8 +279,22 @@ def chunk_text(text: str, max_words_per_chunk: int = 20) -> list[str]:
     Each chunk is roughly 2-3 lines of text (targeting max_words_per_chunk words).
     Tries to break on sentence boundaries first, then on natural phrase breaks.
     """
+    return [" ".join(words) for words in _iter_chunk_words(text, max_words_per_chunk)]
+
+
+def chunk_text_words(text: str, max_words_per_chunk: int = 20) -> list[list[str]]:
+    """Like :func:`chunk_text`, but return each chunk as its list of words.
+
+    Callers that go on to time the chunks (see
+    :func:`map_whisper_words_to_chunks`) can pass these straight through
+    instead of re-splitting the joined strings.
+    """
+    return list(_iter_chunk_words(text, max_words_per_chunk))
+
+
+def _iter_chunk_words(text: str, max_words_per_chunk: int = 20) -> Iterator[list[str]]:
+    """Yield the word list of each display chunk (see :func:`chunk_text`)."""
     sentences = split_into_sentences(text)
-    chunks = []
     current_chunk_words = []
 
     for sentence in sentences:
@@ -217,38 +302,38 @@ def chunk_text(text: str, max_words_per_chunk: int = 20) -> list[str]:
 
         # If adding this sentence would exceed the limit, flush current chunk
         if current_chunk_words and len(current_chunk_words) + len(sentence_words) > max_words_per_chunk:
-            chunks.append(" ".join(current_chunk_words))
+            yield current_chunk_words
             current_chunk_words = []
 
         # If the sentence itself is too long, split it at phrase boundaries
         if len(sentence_words) > max_words_per_chunk:
-            # Split on commas, semicolons, dashes, or conjunctions
-            phrase_break_words = []
-            for w in sentence_words:
-                phrase_break_words.append(w)
-                if len(phrase_break_words) >= max_words_per_chunk:
+            # Split on commas, semicolons, dashes, or conjunctions. The pending
+            # phrase is sentence_words[head:i + 1]; only emitted chunks are
+            # sliced out.
+            head = 0
+            for i in range(len(sentence_words)):
+                pending = i + 1 - head
+                if pending >= max_words_per_chunk:
                     # Look for a natural break point near the end
-                    best_break = len(phrase_break_words)
-                    for j in range(len(phrase_break_words) - 1, max(0, len(phrase_break_words) - 6), -1):
-                        pw = phrase_break_words[j]
+                    best_break = pending
+                    for j in range(pending - 1, max(0, pending - 6), -1):
+                        pw = sentence_words[head + j]
                         if pw.endswith(",") or pw.endswith(";") or pw.endswith("--") or pw.lower() in ("and", "but", "or", "then"):
                             best_break = j + 1
                             break
                     if current_chunk_words:
-                        chunks.append(" ".join(current_chunk_words))
+                        yield current_chunk_words
                         current_chunk_words = []
-                    chunks.append(" ".join(phrase_break_words[:best_break]))
-                    phrase_break_words = phrase_break_words[best_break:]
+                    yield sentence_words[head:head + best_break]
+                    head += best_break
 
-            if phrase_break_words:
-                current_chunk_words.extend(phrase_break_words)
+            if head < len(sentence_words):
+                current_chunk_words.extend(sentence_words[head:])
         else:
             current_chunk_words.extend(sentence_words)
 
     if current_chunk_words:
-        chunks.append(" ".join(current_chunk_words))
-
-    return chunks
+        yield current_chunk_words
 
 
 # ---------------------------------------------------------------------------
@@ -257,82 +342,173 @@ def chunk_text(text: str, max_words_per_chunk: int = 20) -> list[str]:
 
 def normalize_word(word: str) -> str:
     """Strip punctuation for matching purposes."""
-    return re.sub(r"[^a-zA-Z0-9']", "", word).lower()
+    return _NON_WORD_RE.sub("", word).lower()
 
 
 def map_whisper_words_to_chunks(
-    chunks: list[str],
+    chunks: list[str] | list[list[str]],
     whisper_words: list[dict],
 ) -> list[list[dict]]:
     """
     Map Whisper's word-level timestamps to our display chunks.
 
-    Each chunk is a string of words. We match Whisper words sequentially to
+    Each chunk is a string of words, or a word list as returned by
+    :func:`chunk_text_words`. We match Whisper words sequentially to
     chunk words using normalized comparison. Returns a list (one per chunk)
     of lists of word-timing dicts: {"word": str, "start": float, "end": float}.
     """
     chunk_timings = []
     whisper_idx = 0
+    whisper_norm = _normalize_whisper_words(whisper_words)
 
     for chunk in chunks:
-        chunk_words = chunk.split()
-        timings = []
-
-        for cw in chunk_words:
-            cw_norm = normalize_word(cw)
-            if not cw_norm:
-                # Punctuation-only token — give it the timing of the next real word
-                timings.append({"word": cw, "start": None, "end": None})
-                continue
+        words = chunk.split() if isinstance(chunk, str) else chunk
+        timings, whisper_idx = _map_chunk_words(
+            words, whisper_words, whisper_norm, whisper_idx,
+        )
+        chunk_timings.append(timings)
 
-            # Find the matching Whisper word
-            matched = False
-            search_limit = min(whisper_idx + 10, len(whisper_words))
-            for j in range(whisper_idx, search_limit):
+    return chunk_timings
+
+
+def _normalize_whisper_words(whisper_words: list[dict]) -> list[str]:
+    """Normalize every Whisper word once, parallel to *whisper_words*."""
+    return [normalize_word(ww.get("word", "")) for ww in whisper_words]
+
+
+def _map_chunk_words(
+    chunk_words: list[str],
+    whisper_words: list[dict],
+    whisper_norm: list[str],
+    whisper_idx: int,
+) -> tuple[list[dict], int]:
+    """Time one chunk's words against Whisper output starting at *whisper_idx*.
+
+    *whisper_norm* is :func:`_normalize_whisper_words` of *whisper_words*,
+    computed once by the caller rather than on every lookahead probe.
+    Returns ``(timings, next_whisper_idx)`` so consecutive chunks can share
+    a single cursor over the Whisper word stream.
+    """
+    timings = []
+    n_whisper = len(whisper_words)
+
+    for cw in chunk_words:
+        cw_norm = normalize_word(cw)
+        if not cw_norm:
+            # Punctuation-only token — give it the timing of the next real word
+            timings.append({"word": cw, "start": None, "end": None})
+            continue
+
+        # Find the matching Whisper word
+        matched = False
+        search_limit = min(whisper_idx + 10, n_whisper)
+        for j in range(whisper_idx, search_limit):
+            ww_norm = whisper_norm[j]
+            if ww_norm == cw_norm or cw_norm.startswith(ww_norm) or ww_norm.startswith(cw_norm):
                 ww = whisper_words[j]
-                ww_norm = normalize_word(ww.get("word", ""))
-                if ww_norm == cw_norm or cw_norm.startswith(ww_norm) or ww_norm.startswith(cw_norm):
-                    timings.append({
-                        "word": cw,
-                        "start": ww.get("start", 0.0),
-                        "end": ww.get("end", 0.0),
-                    })
-                    whisper_idx = j + 1
-                    matched = True
-                    break
-
-            if not matched:
-                # Fallback: assign interpolated timing
-                if timings and timings[-1]["start"] is not None:
-                    last_end = timings[-1]["end"]
-                    timings.append({"word": cw, "start": last_end, "end": last_end + 0.2})
-                elif whisper_idx < len(whisper_words):
-                    ww = whisper_words[whisper_idx]
-                    timings.append({
-                        "word": cw,
-                        "start": ww.get("start", 0.0),
-                        "end": ww.get("end", 0.0),
-                    })
-                    whisper_idx += 1
-                else:
-                    timings.append({"word": cw, "start": 0.0, "end": 0.0})
-
-        # Fill in None timings (punctuation-only tokens)
-        for i, t in enumerate(timings):
-            if t["start"] is None:
-                if i + 1 < len(timings) and timings[i + 1]["start"] is not None:
-                    t["start"] = timings[i + 1]["start"]
-                    t["end"] = timings[i + 1]["start"]
-                elif i > 0:
-                    t["start"] = timings[i - 1]["end"]
-                    t["end"] = timings[i - 1]["end"]
-                else:
-                    t["start"] = 0.0
-                    t["end"] = 0.0
+                timings.append({
+                    "word": cw,
+                    "start": ww.get("start", 0.0),
+                    "end": ww.get("end", 0.0),
+                })
+                whisper_idx = j + 1
+                matched = True
+                break
+
+        if not matched:
+            # Fallback: assign interpolated timing
+            if timings and timings[-1]["start"] is not None:
+                last_end = timings[-1]["end"]
+                timings.append({"word": cw, "start": last_end, "end": last_end + 0.2})
+            elif whisper_idx < n_whisper:
+                ww = whisper_words[whisper_idx]
+                timings.append({
+                    "word": cw,
+                    "start": ww.get("start", 0.0),
+                    "end": ww.get("end", 0.0),
+                })
+                whisper_idx += 1
+            else:
+                timings.append({"word": cw, "start": 0.0, "end": 0.0})
+
+    # Fill in None timings (punctuation-only tokens)
+    for i, t in enumerate(timings):
+        if t["start"] is None:
+            if i + 1 < len(timings) and timings[i + 1]["start"] is not None:
+                t["start"] = timings[i + 1]["start"]
+                t["end"] = timings[i + 1]["start"]
+            elif i > 0:
+                t["start"] = timings[i - 1]["end"]
+                t["end"] = timings[i - 1]["end"]
+            else:
+                t["start"] = 0.0
+                t["end"] = 0.0
+
+    return timings, whisper_idx
+
+
+def chunk_and_map(
+    source: str | list[dict],
+    whisper_words: list[dict],
+    max_words_per_chunk: int = 20,
+) -> tuple[list[str], list[list[dict]], list[dict] | None]:
+    """Chunk text and attach Whisper timings in a single pass.
 
-        chunk_timings.append(timings)
+    Fused form of :func:`chunk_text` (or :func:`chunk_text_with_chapters`)
+    followed by :func:`map_whisper_words_to_chunks`: each chunk's word list
+    is timed as soon as it is produced, so the text is tokenized once.
 
-    return chunk_timings
+    Parameters
+    ----------
+    source : str | list[dict]
+        Plain text, or chapters as ``{"title", "text"}`` dicts.
+    whisper_words : list[dict]
+        Whisper word timestamps in spoken order.
+    max_words_per_chunk : int
+        Maximum words per display chunk.
+
+    Returns
+    -------
+    (chunks, chunks_with_timings, chapter_ranges) where *chapter_ranges* has
+    the same shape as in :func:`chunk_text_with_chapters`, or is None when
+    *source* is plain text.
+    """
+    chunks: list[str] = []
+    chunk_timings: list[list[dict]] = []
+    whisper_idx = 0
+    whisper_norm = _normalize_whisper_words(whisper_words)
+
+    def emit(text: str) -> int:
+        nonlocal whisper_idx
+        n_words = 0
+        for words in _iter_chunk_words(text, max_words_per_chunk):
+            timings, whisper_idx = _map_chunk_words(
+                words, whisper_words, whisper_norm, whisper_idx,
+            )
+            chunks.append(" ".join(words))
+            chunk_timings.append(timings)
+            n_words += len(words)
+        return n_words
+
+    if isinstance(source, str):
+        emit(source)
+        return chunks, chunk_timings, None
+
+    chapter_ranges: list[dict] = []
+    for ch in source:
+        text = ch.get("text", "").strip()
+        if not text:
+            continue
+        start_idx = len(chunks)
+        word_count = emit(text)
+        chapter_ranges.append({
+            "title": ch.get("title", ""),
+            "start_chunk": start_idx,
+            "end_chunk": len(chunks) - 1,
+            "word_count": word_count,
+        })
+
+    return chunks, chunk_timings, chapter_ranges
 
 
 def chunk_text_with_chapters(
@@ -365,11 +541,12 @@ def chunk_text_with_chapters(
             continue
 
         start_idx = len(flat_chunks)
-        ch_chunks = chunk_text(text, max_words_per_chunk=max_words_per_chunk)
-        flat_chunks.extend(ch_chunks)
+        ch_words = chunk_text_words(text, max_words_per_chunk=max_words_per_chunk)
+        flat_chunks.extend(" ".join(words) for words in ch_words)
         end_idx = len(flat_chunks) - 1
 
-        word_count = len(text.split())
+        # Chunks keep every word of the chapter, so no need to split again
+        word_count = sum(len(words) for words in ch_words)
         chapter_ranges.append({
             "title": title,
             "start_chunk": start_idx,
@@ -457,8 +634,99 @@ def split_audio_file(audio_path: str, output_dir: str, segment_duration: int = 6
     return segments
 
 
+# MPEG audio Layer III bitrates (kbps) by bitrate index, MPEG-1 vs MPEG-2/2.5
+_MP3_BITRATES = {
+    True: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    False: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates by version bits (0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1)
+_MP3_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+# Frame headers checked before treating a stream without a Xing/VBRI
+# header as constant bitrate
+_MP3_CBR_PROBE_FRAMES = 32
+
+
+def _mp3_duration(audio_path: str) -> float | None:
+    """Read an MP3's duration from its headers, without spawning ffprobe.
+
+    Uses the Xing/Info or VBRI frame count when the first frame carries
+    one, otherwise treats the stream as constant bitrate and derives the
+    duration from the data size — the same estimate ffprobe makes for such
+    files (edge-tts output and binary-concatenated segments). Returns None
+    for anything that doesn't start with a Layer III frame.
+    """
+    with open(audio_path, "rb") as f:
+        head = f.read(10)
+        offset = 0
+        if len(head) == 10 and head[:3] == b"ID3":
+            size = (head[6] & 0x7F) << 21 | (head[7] & 0x7F) << 14 | (head[8] & 0x7F) << 7 | (head[9] & 0x7F)
+            offset = 10 + size + (10 if head[5] & 0x10 else 0)  # footer flag
+        f.seek(offset)
+        frame = f.read(64)
+        file_size = os.fstat(f.fileno()).st_size
+        f.seek(max(0, file_size - 128))
+        if f.read(3) == b"TAG":  # trailing ID3v1 tag
+            file_size -= 128
+
+    if len(frame) < 64 or frame[0] != 0xFF or frame[1] & 0xE0 != 0xE0:
+        return None
+    version = (frame[1] >> 3) & 0x03
+    layer = (frame[1] >> 1) & 0x03
+    bitrate_idx = frame[2] >> 4
+    sr_idx = (frame[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_idx in (0, 15) or sr_idx == 3:
+        return None
+
+    mpeg1 = version == 3
+    mono = frame[3] >> 6 == 3
+    sample_rate = _MP3_SAMPLE_RATES[version][sr_idx]
+    samples_per_frame = 1152 if mpeg1 else 576
+
+    # Xing/Info sits after the side info; VBRI at a fixed 32-byte offset
+    xing = 4 + ((17 if mono else 32) if mpeg1 else (9 if mono else 17))
+    if frame[xing:xing + 4] in (b"Xing", b"Info") and frame[xing + 7] & 0x01:
+        frames = int.from_bytes(frame[xing + 8:xing + 12], "big")
+        return frames * samples_per_frame / sample_rate
+    if frame[36:40] == b"VBRI":
+        frames = int.from_bytes(frame[50:54], "big")
+        return frames * samples_per_frame / sample_rate
+
+    # No frame count: only trust a size-based estimate if the stream is
+    # constant bitrate, judged by the next few frame headers
+    bitrate = _MP3_BITRATES[mpeg1][bitrate_idx] * 1000
+    with open(audio_path, "rb") as f:
+        pos = offset
+        for _ in range(_MP3_CBR_PROBE_FRAMES):
+            f.seek(pos)
+            header = f.read(4)
+            if len(header) < 4:
+                break
+            if header[0] != 0xFF or header[1] & 0xE0 != 0xE0 or header[2] >> 4 != bitrate_idx:
+                return None
+            padding = (header[2] >> 1) & 0x01
+            pos += (144 if mpeg1 else 72) * bitrate // sample_rate + padding
+    return (file_size - offset) * 8 / bitrate
+
+
 def get_audio_duration_seconds(audio_path: str) -> float:
-    """Get the duration of an audio file in seconds using ffprobe."""
+    """Get the duration of an audio file in seconds.
+
+    MP3s are measured from their headers; other formats (and MP3s the
+    header reader can't handle) go through ffprobe.
+    """
+    if audio_path.lower().endswith(".mp3"):
+        try:
+            duration = _mp3_duration(audio_path)
+        except OSError:
+            duration = None
+        if duration is not None:
+            return duration
+
     import subprocess
     result = subprocess.run(
         [